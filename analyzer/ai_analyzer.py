@@ -3,95 +3,675 @@ AI-powered code analysis module for CodePulse
 """
 import json
 import os
+import re
+import copy
+import math
+import zlib
+import random
+import string
+import hashlib
+import functools
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional
-from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional, Tuple, Union
 import aiohttp
 from datetime import datetime
+from config import Config
+
+# Fast JSON encode/decode (with stdlib fallback)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# TTL-bounded response cache (with fallback for minimal installs)
+try:
+    from cachetools import TTLCache
+    CACHETOOLS_AVAILABLE = True
+except ImportError:
+    CACHETOOLS_AVAILABLE = False
+
+# Fast non-cryptographic hashing for cache keys (with hashlib fallback)
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Schema-validated decoding of model answers (with plain JSON fallback)
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
 
 # Configure logger for AI Analyzer
 logger = logging.getLogger(__name__)
 
+# Model responses keyed by hash of model + prompt, shared by all analyzer instances
+if CACHETOOLS_AVAILABLE:
+    _response_cache = TTLCache(maxsize=Config.AI_CACHE_SIZE, ttl=Config.AI_CACHE_TTL)
+else:
+    _response_cache = {}
+
+_TOKEN_PATTERN = re.compile(r'\w+')
+
+# Source file suffix -> language name used in prompts
+_LANG_MAP = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.ts': 'typescript',
+    '.java': 'java',
+    '.cs': 'csharp'
+}
+_CODE_SUFFIXES = tuple(_LANG_MAP)
+_SKIP_DIRS = frozenset({'.git', '__pycache__', 'node_modules'})
+
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+if MSGSPEC_AVAILABLE:
+    # Optional fields stay UNSET when the model omits them, so to_builtins() leaves them out
+    class ComplexityAnalysis(msgspec.Struct):
+        overall_complexity: Union[str, msgspec.UnsetType] = msgspec.UNSET
+        maintainability: Union[str, msgspec.UnsetType] = msgspec.UNSET
+        scalability: Union[str, msgspec.UnsetType] = msgspec.UNSET
+
+    class ArchitectureResult(msgspec.Struct):
+        architecture_score: float
+        confidence: Union[float, msgspec.UnsetType] = msgspec.UNSET
+        patterns_detected: Union[List[str], msgspec.UnsetType] = msgspec.UNSET
+        key_findings: Union[List[str], msgspec.UnsetType] = msgspec.UNSET
+        recommendations: Union[List[str], msgspec.UnsetType] = msgspec.UNSET
+        complexity_analysis: Union[ComplexityAnalysis, msgspec.UnsetType] = msgspec.UNSET
+
+    class QualityImprovement(msgspec.Struct):
+        title: str
+        priority: Union[str, msgspec.UnsetType] = msgspec.UNSET
+
+    class CodeQualityResult(msgspec.Struct):
+        score: float
+        confidence: Union[float, msgspec.UnsetType] = msgspec.UNSET
+        maintainability: Union[float, msgspec.UnsetType] = msgspec.UNSET
+        readability: Union[float, msgspec.UnsetType] = msgspec.UNSET
+        improvements: Union[List[QualityImprovement], msgspec.UnsetType] = msgspec.UNSET
+        strengths: Union[List[str], msgspec.UnsetType] = msgspec.UNSET
+        weaknesses: Union[List[str], msgspec.UnsetType] = msgspec.UNSET
+else:
+    ArchitectureResult = None
+    CodeQualityResult = None
+
+
+def _cache_key(text: str) -> bytes:
+    """128-bit digest of text for in-memory cache lookups (collision resistance not required)"""
+    data = text.encode('utf-8')
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128_digest(data)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _decode_answer(content: str, schema: Optional[type] = None) -> Any:
+    """Decode a model answer, validating it against schema when msgspec is available
+    
+    Fields the schema does not declare are kept as decoded, like a plain JSON parse.
+    """
+    if schema is not None:
+        try:
+            data = msgspec.json.decode(content)
+        except msgspec.DecodeError as e:
+            raise json.JSONDecodeError(str(e), content, 0)
+        try:
+            validated = msgspec.convert(data, type=schema)
+        except msgspec.ValidationError:
+            # Valid JSON in another shape (e.g. nested); callers normalize it
+            return data
+        return {**data, **msgspec.to_builtins(validated)}
+    return _json_loads(content)
+
+
+# Base scores for mock responses, varied slightly to show these are fallbacks
+_MOCK_BASE_SCORES = {"architecture": 7.8, "code_quality": 8.2, "performance": 8.5, "security": 3.0}
+
+
+def _mock_architecture(timestamp: str) -> Dict[str, Any]:
+    """Mock architecture analysis"""
+    score = _MOCK_BASE_SCORES["architecture"] + random.uniform(-0.3, 0.3)
+    return {
+        "architecture_score": round(score, 1),
+        "patterns_detected": ["Layered Architecture", "Modular Design"],
+        "key_findings": [
+            "Well-organized project structure with clear separation of concerns",
+            "Good use of modular design patterns",
+            "Consistent naming conventions throughout the codebase"
+        ],
+        "recommendations": [
+            "Consider implementing comprehensive unit tests",
+            "Add API documentation for better maintainability",
+            "Implement error handling best practices"
+        ],
+        "complexity_analysis": {
+            "overall_complexity": "Medium",
+            "maintainability": "Good", 
+            "scalability": "Good"
+        },
+        "confidence": 0.7,  # Add confidence for fallback
+        "ai_analysis_available": True,
+        "timestamp": timestamp
+    }
+
+
+def _mock_code_quality(timestamp: str) -> Dict[str, Any]:
+    """Mock code quality analysis"""
+    score = _MOCK_BASE_SCORES["code_quality"] + random.uniform(-0.3, 0.3)
+    return {
+        "score": round(score, 1),
+        "maintainability": 8,
+        "readability": 7,
+        "improvements": [
+            {"title": "Increase test coverage to 80%+", "priority": "high"},
+            {"title": "Add comprehensive documentation", "priority": "medium"},
+            {"title": "Implement consistent error handling", "priority": "medium"},
+            {"title": "Add code comments for complex logic", "priority": "low"}
+        ],
+        "strengths": [
+            "Clean and readable code structure",
+            "Consistent naming conventions",
+            "Good separation of concerns",
+            "Modular design approach"
+        ],
+        "weaknesses": [
+            "Limited test coverage",
+            "Missing documentation",
+            "Inconsistent error handling",
+            "Some complex functions need refactoring"
+        ],
+        "confidence": 0.8,  # Add confidence for fallback
+        "ai_analysis_available": True,
+        "timestamp": timestamp
+    }
+
+
+def _mock_performance(timestamp: str) -> Dict[str, Any]:
+    """Mock performance analysis"""
+    score = _MOCK_BASE_SCORES["performance"] + random.uniform(-0.3, 0.3)
+    return {
+        "score": round(score, 1),
+        "bottlenecks": [
+            "Database query optimization needed",
+            "Large file processing could be async",
+            "Memory usage in data processing"
+        ],
+        "recommendations": [
+            "Implement database query optimization",
+            "Use async operations for I/O bound tasks",
+            "Add caching for frequently accessed data",
+            "Optimize memory usage in large data processing"
+        ],
+        "confidence": 0.75,  # Add confidence for fallback
+        "ai_analysis_available": True,
+        "timestamp": timestamp
+    }
+
+
+def _mock_security(timestamp: str) -> Dict[str, Any]:
+    """Mock security analysis"""
+    risk_score = int(_MOCK_BASE_SCORES["security"] + random.uniform(-1, 1))
+    risk_score = max(1, min(5, risk_score))  # Keep within 1-5 range
+    return {
+        "risk_score": risk_score,
+        "vulnerabilities": [
+            {"type": "Dependencies", "severity": "medium", "description": "Some outdated packages with known vulnerabilities"},
+            {"type": "Input Validation", "severity": "low", "description": "Missing input sanitization in some endpoints"},
+            {"type": "Authentication", "severity": "low", "description": "Token handling could be more secure"}
+        ],
+        "recommendations": [
+            "Update all dependencies to latest secure versions",
+            "Implement comprehensive input validation",
+            "Add security headers to HTTP responses",
+            "Use secure token storage practices",
+            "Implement rate limiting for API endpoints"
+        ],
+        "confidence": 0.6,  # Add confidence for fallback
+        "ai_analysis_available": True,
+        "timestamp": timestamp
+    }
+
+
+def _mock_generic(timestamp: str) -> Dict[str, Any]:
+    """Mock response for unknown analysis types"""
+    return {
+        "ai_analysis_available": True,
+        "score": 7.5,
+        "confidence": 0.5,  # Add confidence for fallback
+        "analysis_complete": True,
+        "timestamp": timestamp
+    }
+
+
+# Analysis type -> builder of a fresh mock response
+_MOCK_RESPONSES: Dict[str, Callable[[str], Dict[str, Any]]] = {
+    "architecture": _mock_architecture,
+    "code_quality": _mock_code_quality,
+    "performance": _mock_performance,
+    "security": _mock_security
+}
+
+
+# Prompt templates: the fixed instructions and schema come first, so repeated
+# calls share a byte-identical prefix, and only the trailing data varies
+_FILE_QUALITY_PROMPT = string.Template("""
+Analyze the code below for quality issues.
+
+Provide analysis in JSON format with scores on 1-10 scale (provide actual analysis, not examples):
+{
+    "quality_score": [ANALYZE_AND_SCORE_BASED_ON_CODE_QUALITY],
+    "issues": [
+        {
+            "type": "performance|readability|security|maintainability",
+            "severity": "low|medium|high|critical",
+            "line": [LINE_NUMBER],
+            "description": "[SPECIFIC_ISSUE_DESCRIPTION]",
+            "suggestion": "[SPECIFIC_IMPROVEMENT_SUGGESTION]"
+        }
+    ],
+    "suggestions": ["[SPECIFIC_IMPROVEMENT_SUGGESTIONS]"],
+    "security_concerns": ["[SPECIFIC_SECURITY_ISSUES_IF_ANY]"],
+    "maintainability_score": [SCORE_BASED_ON_MAINTAINABILITY_1_TO_10]
+}
+
+File: $file_path
+Code:
+```$language
+$file_content
+```
+""")
+
+_BATCH_QUALITY_PROMPT = string.Template("""
+Analyze the source files below for code quality issues.
+
+Provide analysis as a JSON array with one object per file, keyed by its FILE number, with scores on 1-10 scale (provide actual analysis, not examples):
+[
+    {
+        "file_id": [FILE_NUMBER],
+        "quality_score": [ANALYZE_AND_SCORE_BASED_ON_CODE_QUALITY],
+        "issues": [
+            {
+                "type": "performance|readability|security|maintainability",
+                "severity": "low|medium|high|critical",
+                "line": [LINE_NUMBER],
+                "description": "[SPECIFIC_ISSUE_DESCRIPTION]",
+                "suggestion": "[SPECIFIC_IMPROVEMENT_SUGGESTION]"
+            }
+        ],
+        "suggestions": ["[SPECIFIC_IMPROVEMENT_SUGGESTIONS]"],
+        "security_concerns": ["[SPECIFIC_SECURITY_ISSUES_IF_ANY]"],
+        "maintainability_score": [SCORE_BASED_ON_MAINTAINABILITY_1_TO_10]
+    }
+]
+
+$sections
+""")
+
+_ROADMAP_PROMPT = """
+Create an improvement roadmap based on analysis results.
+
+Return JSON format:
+{
+    "immediate_phase": {
+        "duration": "1-2 weeks",
+        "tasks": ["Fix critical issues"],
+        "effort_estimate": "40 hours"
+    },
+    "short_term_phase": {
+        "duration": "1-4 weeks",
+        "tasks": ["Improve test coverage"]
+    }
+}
+"""
+
+_ARCHITECTURE_PROMPT = string.Template("""
+Analyze the architecture of the repository described below.
+
+Provide architecture analysis in JSON format with scores on 1-10 scale (analyze the specific repository, not examples):
+{
+    "architecture_score": [SCORE_BASED_ON_ACTUAL_ARCHITECTURE_1_TO_10],
+    "patterns_detected": ["[ACTUAL_PATTERNS_FOUND_IN_CODE]"],
+    "key_findings": [
+        "[SPECIFIC_FINDINGS_ABOUT_THIS_REPOSITORY]",
+        "[ACTUAL_OBSERVATIONS_ABOUT_CODE_STRUCTURE]"
+    ],
+    "recommendations": [
+        "[SPECIFIC_RECOMMENDATIONS_FOR_THIS_CODEBASE]",
+        "[TARGETED_IMPROVEMENTS_BASED_ON_ANALYSIS]"
+    ],
+    "complexity_analysis": {
+        "overall_complexity": "[Low|Medium|High]",
+        "maintainability": "[Poor|Fair|Good|Excellent]",
+        "scalability": "[Poor|Fair|Good|Excellent]"
+    }
+}
+
+Repository: $repo_name
+Language: $repo_language
+Size: $repo_size KB
+
+Test Coverage: $coverage_pct%
+Issues Found: $critical_issues critical, $warnings_count warnings
+""")
+
+_REPO_QUALITY_PROMPT = string.Template("""
+Analyze the code quality of the repository described below.
+
+Provide code quality analysis in JSON format with scores on 1-10 scale (analyze this specific repository):
+{
+    "score": [SCORE_BASED_ON_ACTUAL_ANALYSIS_1_TO_10],
+    "maintainability": [MAINTAINABILITY_SCORE_1_TO_10],
+    "readability": [READABILITY_SCORE_1_TO_10],
+    "improvements": [
+        {"title": "[SPECIFIC_IMPROVEMENT_FOR_THIS_REPO]", "priority": "high|medium|low"},
+        {"title": "[ANOTHER_SPECIFIC_IMPROVEMENT]", "priority": "high|medium|low"}
+    ],
+    "strengths": ["[ACTUAL_STRENGTHS_OBSERVED]", "[SPECIFIC_POSITIVE_ASPECTS]"],
+    "weaknesses": ["[ACTUAL_WEAKNESSES_FOUND]", "[SPECIFIC_ISSUES_IDENTIFIED]"]
+}
+
+Test Coverage: $coverage_pct%
+Critical Issues: $critical_issues
+Warnings: $warnings_count
+""")
+
+
+class SemanticPromptCache:
+    """
+    Approximate prompt cache that reuses responses for near-duplicate prompts
+    
+    Prompts are embedded by signed feature hashing of their word tokens into a
+    fixed number of buckets. Vectors are L2-normalized, so the dot product of two
+    embeddings is their cosine similarity.
+    
+    Entries are only compared within one scope (model, analysis kind and repository),
+    and callers embed just the variable part of a prompt: the shared instructions
+    would otherwise make every repository's prompts look alike.
+    """
+    
+    def __init__(self, threshold: float = 0.92, max_entries: int = 256, dimensions: int = 384):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.dimensions = dimensions
+        self._scopes: List[str] = []
+        self._vectors: List[Dict[int, float]] = []
+        self._responses: List[Any] = []
+    
+    def embed(self, text: str) -> Dict[int, float]:
+        """Embed text as a sparse, normalized hashed bag-of-words vector"""
+        weights: Dict[int, float] = {}
+        for token in _TOKEN_PATTERN.findall(text.lower()):
+            digest = zlib.crc32(token.encode('utf-8'))
+            bucket = digest % self.dimensions
+            weights[bucket] = weights.get(bucket, 0.0) + (1.0 if digest & 0x80000000 else -1.0)
+        
+        norm = math.sqrt(sum(w * w for w in weights.values()))
+        if not norm:
+            return {}
+        return {bucket: w / norm for bucket, w in weights.items() if w}
+    
+    def lookup(self, scope: str, vector: Dict[int, float]) -> Optional[Any]:
+        """Return the stored response in scope most similar to vector if it clears the threshold"""
+        best_similarity, best_index = 0.0, None
+        for index, cached in enumerate(self._vectors):
+            if self._scopes[index] != scope:
+                continue
+            small, large = (vector, cached) if len(vector) <= len(cached) else (cached, vector)
+            similarity = sum(w * large.get(bucket, 0.0) for bucket, w in small.items())
+            if similarity > best_similarity:
+                best_similarity, best_index = similarity, index
+        
+        if best_index is not None and best_similarity >= self.threshold:
+            return self._responses[best_index]
+        return None
+    
+    def add(self, scope: str, vector: Dict[int, float], response: Any) -> None:
+        """Store a response under its scope and prompt embedding, evicting the oldest entry when full"""
+        if not vector:
+            return
+        if len(self._vectors) >= self.max_entries:
+            self._scopes.pop(0)
+            self._vectors.pop(0)
+            self._responses.pop(0)
+        self._scopes.append(scope)
+        self._vectors.append(vector)
+        self._responses.append(response)
+
+
+class _StreamingJsonScanner:
+    """Tracks streamed text to find where its first top-level JSON value ends"""
+    
+    def __init__(self):
+        self.text = ""
+        self.start: Optional[int] = None
+        self.end: Optional[int] = None
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+    
+    def feed(self, chunk: str) -> bool:
+        """Append a chunk of text, returning True once the top-level value is complete"""
+        offset = len(self.text)
+        self.text += chunk
+        if self.end is not None:
+            return True
+        
+        for i, ch in enumerate(chunk, offset):
+            if self.start is None:
+                # Skip any prose or markdown fence before the JSON value
+                if ch in '{[':
+                    self.start = i
+                    self._depth = 1
+                continue
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == '\\':
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in '{[':
+                self._depth += 1
+            elif ch in '}]':
+                self._depth -= 1
+                if self._depth == 0:
+                    self.end = i + 1
+                    return True
+        return False
+    
+    @property
+    def value_text(self) -> str:
+        """The complete JSON value if it has closed, otherwise everything received"""
+        if self.end is not None:
+            return self.text[self.start:self.end]
+        return self.text
+
+
+_semantic_cache = SemanticPromptCache(
+    threshold=Config.AI_SEMANTIC_CACHE_THRESHOLD,
+    max_entries=Config.AI_SEMANTIC_CACHE_SIZE
+)
+
+# Per-file content cap for prompts, keeps a full batch inside the model context window.
+# Measured in tokens when tiktoken is installed, otherwise in characters.
+MAX_BATCH_FILE_TOKENS = 500
+MAX_BATCH_FILE_CHARS = 2000
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding(model: str):
+    """Tokenizer for model, imported lazily on first use; None when tiktoken cannot be loaded"""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        # Encodings are downloaded on first use, which can fail offline
+        logger.warning("⚠️ Could not load tokenizer for %s, truncating by characters: %s", model, e)
+        return None
+
+
+def _truncate_for_prompt(text: str, model: str) -> str:
+    """Cut file content to the per-file prompt budget"""
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return text[:MAX_BATCH_FILE_CHARS]
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= MAX_BATCH_FILE_TOKENS:
+        return text
+    return encoding.decode(tokens[:MAX_BATCH_FILE_TOKENS])
+
+
+def create_http_session() -> aiohttp.ClientSession:
+    """Create a pooled HTTP session for model requests; call it on the event loop that will use it
+    
+    The session carries no credentials, since each analyzer sends its own Authorization header,
+    so one session can serve every request for as long as its loop runs.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=32,
+        limit_per_host=16,
+        keepalive_timeout=75,
+        ttl_dns_cache=300
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=Config.AI_TIMEOUT)
+    )
+
+
 class AIAnalyzer:
     """AI-powered code analysis using GitHub Models"""
     
-    def __init__(self, github_token: str = None, model: str = "gpt-4o-mini"):
+    def __init__(self, github_token: str = None, model: str = "gpt-4o-mini",
+                 session: Optional[aiohttp.ClientSession] = None):
         self.github_token = github_token or os.getenv('GITHUB_TOKEN')
+        # Checked first by every analysis so the no-token path skips prompt building
+        self._available = bool(self.github_token)
         self.model = model  # Remove openai/ prefix for GitHub Models
         self.base_url = "https://models.github.ai/inference"
         self.headers = {
             "Authorization": f"Bearer {self.github_token}",
             "Content-Type": "application/json"
         }
-        logger.info(f"🧠 AIAnalyzer initialized with model: {self.model}")
-        logger.info(f"🔑 GitHub token available: {bool(self.github_token)}")
+        # HTTP session from the caller (kept open across analyses), or one created lazily on first API call
+        self._session = session
+        self._owns_session = session is None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        logger.info("🧠 AIAnalyzer initialized with model: %s", self.model)
+        logger.info("🔑 GitHub token available: %s", self._available)
+    
+    async def __aenter__(self) -> "AIAnalyzer":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the HTTP session, creating an own one for the running event loop if needed"""
+        if not self._owns_session:
+            return self._session
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = create_http_session()
+            self._session_loop = loop
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the HTTP session if this analyzer created it (a caller's session stays open)"""
+        if not self._owns_session:
+            return
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
     
-    async def analyze_code_quality(self, file_content: str, file_path: str, language: str) -> Dict[str, Any]:
-        """Analyze code quality using AI"""
-        if not self.github_token:
+    async def analyze_file_quality(self, file_content: str, file_path: str, language: str) -> Dict[str, Any]:
+        """Analyze code quality of a single file using AI"""
+        if not self._available:
             return self._fallback_analysis("code_quality")
             
-        prompt = f"""
-        Analyze this {language} code for quality issues:
-        
-        File: {file_path}
-        Code:
-        ```{language}
-        {file_content[:2000]}  # Limit content size
-        ```
-        
-        Provide analysis in JSON format with scores on 1-10 scale (provide actual analysis, not examples):
-        {{
-            "quality_score": [ANALYZE_AND_SCORE_BASED_ON_CODE_QUALITY],
-            "issues": [
-                {{
-                    "type": "performance|readability|security|maintainability",
-                    "severity": "low|medium|high|critical", 
-                    "line": [LINE_NUMBER],
-                    "description": "[SPECIFIC_ISSUE_DESCRIPTION]",
-                    "suggestion": "[SPECIFIC_IMPROVEMENT_SUGGESTION]"
-                }}
-            ],
-            "suggestions": ["[SPECIFIC_IMPROVEMENT_SUGGESTIONS]"],
-            "security_concerns": ["[SPECIFIC_SECURITY_ISSUES_IF_ANY]"],
-            "maintainability_score": [SCORE_BASED_ON_MAINTAINABILITY_1_TO_10]
-        }}
+        prompt = _FILE_QUALITY_PROMPT.substitute(
+            file_path=file_path, language=language,
+            file_content=_truncate_for_prompt(file_content, self.model)
+        )
+        
+        return await self._call_ai_model(prompt, "code_quality")
+    
+    async def analyze_code_quality_batch(self, files: List[Tuple[str, str, str]],
+                                         repo: Optional[str] = None) -> List[Dict[str, Any]]:
         """
+        Analyze code quality of several files with a single AI request
         
-        return await self._call_ai_model(prompt)
+        Args:
+            files: (file_content, file_path, language) tuples
+            repo: Repository the files belong to, which lets near-duplicate batches share a cached answer
+            
+        Returns:
+            One analysis dict per input file, in input order
+        """
+        if not self._available:
+            return [self._fallback_analysis("code_quality") for _ in files]
+        if not files:
+            return []
+        
+        sections = "\n\n".join(
+            f"### FILE {i}: {file_path}\n```{language}\n{_truncate_for_prompt(file_content, self.model)}\n```"
+            for i, (file_content, file_path, language) in enumerate(files)
+        )
+        
+        prompt = _BATCH_QUALITY_PROMPT.substitute(sections=sections)
+        
+        result = await self._call_ai_model(prompt, "code_quality", repo=repo, variable_text=sections)
+        
+        # Accept a bare array or an object wrapping it under "files"
+        entries = result.get('files', []) if isinstance(result, dict) else result
+        by_id = {}
+        for position, entry in enumerate(entries or []):
+            if isinstance(entry, dict):
+                by_id[entry.get('file_id', position)] = entry
+        
+        return [by_id.get(i) or self._fallback_analysis("code_quality") for i in range(len(files))]
     
     async def generate_improvement_roadmap(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
         """Generate improvement roadmap"""
-        if not self.github_token:
+        if not self._available:
             return self._fallback_roadmap()
-            
-        prompt = f"""
-        Create an improvement roadmap based on analysis results.
-        
-        Return JSON format:
-        {{
-            "immediate_phase": {{
-                "duration": "1-2 weeks",
-                "tasks": ["Fix critical issues"],
-                "effort_estimate": "40 hours"
-            }},
-            "short_term_phase": {{
-                "duration": "1-4 weeks", 
-                "tasks": ["Improve test coverage"]
-            }}
-        }}
-        """
         
-        return await self._call_ai_model(prompt)
+        return await self._call_ai_model(_ROADMAP_PROMPT, "roadmap")
     
     async def analyze_architecture(self, repo_info: Dict[str, Any], 
                                  coverage_results: Dict[str, Any], 
                                  issues: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze repository architecture using AI"""
-        logger.info(f"🏗️  Starting architecture analysis for {repo_info.get('name', 'Unknown')}")
+        logger.info("🏗️  Starting architecture analysis for %s", repo_info.get('name', 'Unknown'))
         
-        if not self.github_token:
+        if not self._available:
             logger.warning("⚠️ No GitHub token available, using fallback architecture analysis")
             return self._fallback_architecture_analysis()
             
@@ -103,41 +683,20 @@ class AIAnalyzer:
         critical_issues = len(issues.get('critical_issues', []))
         warnings_count = len(issues.get('warnings', []))
         
-        logger.info(f"📊 Repository metrics - Language: {repo_language}, Size: {repo_size}KB, Coverage: {coverage_pct}%, Critical Issues: {critical_issues}")
+        logger.info("📊 Repository metrics - Language: %s, Size: %sKB, Coverage: %s%%, Critical Issues: %d",
+                    repo_language, repo_size, coverage_pct, critical_issues)
         
-        prompt = f"""
-        Analyze the architecture of this repository:
-        
-        Repository: {repo_name}
-        Language: {repo_language}
-        Size: {repo_size} KB
-        
-        Test Coverage: {coverage_pct}%
-        Issues Found: {critical_issues} critical, {warnings_count} warnings
-        
-        Provide architecture analysis in JSON format with scores on 1-10 scale (analyze the specific repository, not examples):
-        {{
-            "architecture_score": [SCORE_BASED_ON_ACTUAL_ARCHITECTURE_1_TO_10],
-            "patterns_detected": ["[ACTUAL_PATTERNS_FOUND_IN_CODE]"],
-            "key_findings": [
-                "[SPECIFIC_FINDINGS_ABOUT_THIS_REPOSITORY]",
-                "[ACTUAL_OBSERVATIONS_ABOUT_CODE_STRUCTURE]"
-            ],
-            "recommendations": [
-                "[SPECIFIC_RECOMMENDATIONS_FOR_THIS_CODEBASE]",
-                "[TARGETED_IMPROVEMENTS_BASED_ON_ANALYSIS]"
-            ],
-            "complexity_analysis": {{
-                "overall_complexity": "[Low|Medium|High]",
-                "maintainability": "[Poor|Fair|Good|Excellent]",
-                "scalability": "[Poor|Fair|Good|Excellent]"
-            }}
-        }}
-        """
+        prompt = _ARCHITECTURE_PROMPT.substitute(
+            repo_name=repo_name, repo_language=repo_language, repo_size=repo_size,
+            coverage_pct=coverage_pct, critical_issues=critical_issues, warnings_count=warnings_count
+        )
         
         try:
             logger.info("🔄 Calling AI model for architecture analysis")
-            result = await self._call_ai_model(prompt)
+            result = await self._call_ai_model(
+                prompt, "architecture", ArchitectureResult, repo=repo_info.get('full_name') or None,
+                variable_text=f"{repo_language} {repo_size} {coverage_pct} {critical_issues} {warnings_count}"
+            )
             
             # Handle both flat and nested AI response structures
             if 'architecture_score' in result:
@@ -164,10 +723,10 @@ class AIAnalyzer:
                 logger.warning("⚠️ AI model response missing architecture_score, using fallback")
                 return self._fallback_architecture_analysis()
                 
-            logger.info(f"✅ Architecture analysis completed - Score: {result.get('architecture_score', 'N/A')}")
+            logger.info("✅ Architecture analysis completed - Score: %s", result.get('architecture_score', 'N/A'))
             return result
         except Exception as e:
-            logger.error(f"❌ Architecture analysis failed: {str(e)}")
+            logger.error("❌ Architecture analysis failed: %s", e)
             return self._fallback_architecture_analysis()
     
     def _fallback_architecture_analysis(self) -> Dict[str, Any]:
@@ -200,7 +759,7 @@ class AIAnalyzer:
         """Analyze code quality using repository-level data"""
         logger.info("🔍 Starting code quality analysis")
         
-        if not self.github_token:
+        if not self._available:
             logger.warning("⚠️ No GitHub token available, using fallback code quality analysis")
             return self._fallback_code_quality_analysis()
             
@@ -208,32 +767,16 @@ class AIAnalyzer:
         warnings_count = len(issues.get('warnings', []))
         coverage_pct = coverage_results.get('coverage_percentage', 0)
         
-        logger.info(f"📊 Code quality metrics - Coverage: {coverage_pct}%, Critical Issues: {critical_issues}, Warnings: {warnings_count}")
-        
-        prompt = f"""
-        Analyze the code quality of this repository:
+        logger.info("📊 Code quality metrics - Coverage: %s%%, Critical Issues: %d, Warnings: %d",
+                    coverage_pct, critical_issues, warnings_count)
         
-        Test Coverage: {coverage_pct}%
-        Critical Issues: {critical_issues}
-        Warnings: {warnings_count}
-        
-        Provide code quality analysis in JSON format with scores on 1-10 scale (analyze this specific repository):
-        {{
-            "score": [SCORE_BASED_ON_ACTUAL_ANALYSIS_1_TO_10],
-            "maintainability": [MAINTAINABILITY_SCORE_1_TO_10],
-            "readability": [READABILITY_SCORE_1_TO_10],
-            "improvements": [
-                {{"title": "[SPECIFIC_IMPROVEMENT_FOR_THIS_REPO]", "priority": "high|medium|low"}},
-                {{"title": "[ANOTHER_SPECIFIC_IMPROVEMENT]", "priority": "high|medium|low"}}
-            ],
-            "strengths": ["[ACTUAL_STRENGTHS_OBSERVED]", "[SPECIFIC_POSITIVE_ASPECTS]"],
-            "weaknesses": ["[ACTUAL_WEAKNESSES_FOUND]", "[SPECIFIC_ISSUES_IDENTIFIED]"]
-        }}
-        """
+        prompt = _REPO_QUALITY_PROMPT.substitute(
+            coverage_pct=coverage_pct, critical_issues=critical_issues, warnings_count=warnings_count
+        )
         
         try:
             logger.info("🔄 Calling AI model for code quality analysis")
-            result = await self._call_ai_model(prompt)
+            result = await self._call_ai_model(prompt, "code_quality", CodeQualityResult)
             
             # Handle both flat and nested AI response structures
             if 'score' in result:
@@ -261,10 +804,10 @@ class AIAnalyzer:
                 logger.warning("⚠️ AI model response missing code quality score, using fallback")
                 return self._fallback_code_quality_analysis()
                 
-            logger.info(f"✅ Code quality analysis completed - Score: {result.get('score', 'N/A')}")
+            logger.info("✅ Code quality analysis completed - Score: %s", result.get('score', 'N/A'))
             return result
         except Exception as e:
-            logger.error(f"❌ Code quality analysis failed: {str(e)}")
+            logger.error("❌ Code quality analysis failed: %s", e)
             return self._fallback_code_quality_analysis()
     
     def _fallback_code_quality_analysis(self) -> Dict[str, Any]:
@@ -299,16 +842,16 @@ class AIAnalyzer:
         """Analyze performance patterns in the codebase"""
         logger.info("⚡ Starting performance analysis")
         
-        if not self.github_token:
+        if not self._available:
             logger.warning("⚠️ No GitHub token available, using fallback performance analysis")
             return self._fallback_performance_analysis()
             
         try:
-            result = await self._call_ai_model("performance analysis")
+            result = await self._call_ai_model("performance analysis", "performance")
             logger.info("✅ Performance analysis completed")
             return result
         except Exception as e:
-            logger.error(f"❌ Performance analysis failed: {str(e)}")
+            logger.error("❌ Performance analysis failed: %s", e)
             return self._fallback_performance_analysis()
     
     def _fallback_performance_analysis(self) -> Dict[str, Any]:
@@ -331,16 +874,16 @@ class AIAnalyzer:
         """Analyze security aspects of the codebase"""
         logger.info("🔒 Starting security analysis")
         
-        if not self.github_token:
+        if not self._available:
             logger.warning("⚠️ No GitHub token available, using fallback security analysis")
             return self._fallback_security_analysis()
             
         try:
-            result = await self._call_ai_model("security analysis")
+            result = await self._call_ai_model("security analysis", "security")
             logger.info("✅ Security analysis completed")
             return result
         except Exception as e:
-            logger.error(f"❌ Security analysis failed: {str(e)}")
+            logger.error("❌ Security analysis failed: %s", e)
             return self._fallback_security_analysis()
     
     def _fallback_security_analysis(self) -> Dict[str, Any]:
@@ -362,20 +905,54 @@ class AIAnalyzer:
             "fallback_analysis": True
         }
     
-    async def _call_ai_model(self, prompt: str) -> Dict[str, Any]:
-        """Call AI model with fallback"""
+    async def _call_ai_model(self, prompt: str, analysis_type: str,
+                             schema: Optional[type] = None, repo: Optional[str] = None,
+                             variable_text: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Call AI model with response caching and fallback; schema is an optional msgspec Struct type for the answer
+        
+        Near-duplicate prompts only share a response when repo names the repository and
+        variable_text holds the part of the prompt that varies; otherwise only exact repeats do.
+        """
+        # If no GitHub token, return fallback
+        if not self._available:
+            logger.warning("⚠️ No GitHub token available for AI analysis, using fallback")
+            return self._get_fallback_response(analysis_type)
+        
+        cache_key = _cache_key(f"{self.model}|{prompt}")
+        if Config.ENABLE_CACHING and cache_key in _response_cache:
+            logger.info("♻️ Using cached AI model response")
+            # Callers annotate the result in place, so hand out a private copy
+            return copy.deepcopy(_response_cache[cache_key])
+        
+        prompt_vector = None
+        semantic_scope = f"{self.model}|{analysis_type}|{repo}"
+        if Config.ENABLE_CACHING and Config.AI_SEMANTIC_CACHE and repo and variable_text:
+            prompt_vector = _semantic_cache.embed(variable_text)
+            cached = _semantic_cache.lookup(semantic_scope, prompt_vector)
+            if cached is not None:
+                logger.info("♻️ Using AI model response cached for a near-duplicate prompt")
+                return copy.deepcopy(cached)
+        
+        result = await self._request_completion(prompt, schema)
+        if result is None:
+            return self._get_fallback_response(analysis_type)
+        
+        if Config.ENABLE_CACHING:
+            if not CACHETOOLS_AVAILABLE and len(_response_cache) >= Config.AI_CACHE_SIZE:
+                # Plain dict fallback: evict the oldest entry
+                _response_cache.pop(next(iter(_response_cache)))
+            _response_cache[cache_key] = copy.deepcopy(result)
+            if prompt_vector is not None:
+                _semantic_cache.add(semantic_scope, prompt_vector, copy.deepcopy(result))
+        return result
+    
+    async def _request_completion(self, prompt: str, schema: Optional[type] = None) -> Optional[Any]:
+        """Send a chat completion request, returning the parsed JSON answer or None on failure"""
         try:
-            # If no GitHub token, return fallback
-            if not self.github_token:
-                logger.warning("⚠️ No GitHub token available for AI analysis, using fallback")
-                return self._get_fallback_response(prompt)
-            
             # Make actual API call to GitHub Models
             logger.info("🔄 Making API call to GitHub Models...")
             
-            import aiohttp
-            import json
-            
             payload = {
                 "messages": [
                     {
@@ -389,164 +966,82 @@ class AIAnalyzer:
                 ],
                 "model": self.model,
                 "temperature": 0.3,
-                "max_tokens": 1000
+                "max_tokens": 1000,
+                "stream": True
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    "https://models.github.ai/inference/chat/completions",
-                    headers=self.headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=30),
-                    ssl=False  # Disable SSL verification for development
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        content = data['choices'][0]['message']['content']
-                        
-                        # Try to parse JSON response
-                        try:
-                            # Handle markdown code blocks
-                            content = content.strip()
-                            if content.startswith('```json'):
-                                # Extract JSON from markdown code block
-                                content = content.replace('```json', '').replace('```', '').strip()
-                            elif content.startswith('```'):
-                                # Extract from generic code block
-                                content = content.replace('```', '').strip()
-                            
-                            result = json.loads(content)
-                            logger.info("✅ AI model response received and parsed successfully")
-                            return result
-                        except json.JSONDecodeError as e:
-                            logger.warning(f"⚠️ AI model returned non-JSON response: {content[:200]}...")
-                            logger.warning(f"JSON decode error: {e}")
-                            return self._get_fallback_response(prompt)
+            session = await self._get_session()
+            async with session.post(
+                f"{self.base_url}/chat/completions",
+                data=_json_dumps(payload),
+                headers=self.headers,
+                ssl=False  # Disable SSL verification for development
+            ) as response:
+                if response.status == 200:
+                    if response.content_type == 'text/event-stream':
+                        content = await self._read_streamed_content(response)
                     else:
-                        # Log the error details for debugging
-                        try:
-                            error_text = await response.text()
-                            logger.error(f"❌ AI API call failed with status {response.status}")
-                            logger.error(f"📝 Full error response: {error_text}")
-                            logger.error(f"🔍 Request headers: {dict(response.request_info.headers)}")
-                            logger.error(f"🌐 Request URL: {response.request_info.url}")
-                        except Exception as e:
-                            logger.error(f"❌ AI API call failed with status {response.status}, could not read response: {e}")
-                        return self._get_fallback_response(prompt)
+                        data = _json_loads(await response.read())
+                        content = data['choices'][0]['message']['content']
+                    
+                    # Try to parse JSON response
+                    try:
+                        # Handle markdown code blocks
+                        content = content.strip()
+                        if content.startswith('```json'):
+                            # Extract JSON from markdown code block
+                            content = content.replace('```json', '').replace('```', '').strip()
+                        elif content.startswith('```'):
+                            # Extract from generic code block
+                            content = content.replace('```', '').strip()
                         
+                        result = _decode_answer(content, schema)
+                        logger.info("✅ AI model response received and parsed successfully")
+                        return result
+                    except json.JSONDecodeError as e:
+                        logger.warning("⚠️ AI model returned non-JSON response: %.200s...", content)
+                        logger.warning("JSON decode error: %s", e)
+                        return None
+                else:
+                    # Log the error details for debugging
+                    try:
+                        error_text = await response.text()
+                        logger.error("❌ AI API call failed with status %s", response.status)
+                        logger.error("📝 Full error response: %s", error_text)
+                        logger.error("🔍 Request headers: %s", dict(response.request_info.headers))
+                        logger.error("🌐 Request URL: %s", response.request_info.url)
+                    except Exception as e:
+                        logger.error("❌ AI API call failed with status %s, could not read response: %s", response.status, e)
+                    return None
+                    
         except Exception as e:
-            logger.error(f"❌ AI model call failed: {str(e)}, using fallback")
-            return self._get_fallback_response(prompt)
-    
-    def _get_fallback_response(self, prompt: str) -> Dict[str, Any]:
-        """Generate fallback response based on prompt type"""
-        import random
-        
-        # Add some randomness to demonstrate fallback vs real AI
-        base_scores = {"architecture": 7.8, "code_quality": 8.2, "performance": 8.5, "security": 3.0}
-        
-        if "architecture" in prompt.lower():
-            # Add small random variation to show these are fallbacks
-            score = base_scores["architecture"] + random.uniform(-0.3, 0.3)
-            return {
-                "architecture_score": round(score, 1),
-                "patterns_detected": ["Layered Architecture", "Modular Design"],
-                "key_findings": [
-                    "Well-organized project structure with clear separation of concerns",
-                    "Good use of modular design patterns",
-                    "Consistent naming conventions throughout the codebase"
-                ],
-                "recommendations": [
-                    "Consider implementing comprehensive unit tests",
-                    "Add API documentation for better maintainability",
-                    "Implement error handling best practices"
-                ],
-                "complexity_analysis": {
-                    "overall_complexity": "Medium",
-                    "maintainability": "Good", 
-                    "scalability": "Good"
-                },
-                "confidence": 0.7,  # Add confidence for fallback
-                "ai_analysis_available": True,
-                "timestamp": datetime.now().isoformat()
-            }
-        elif "code quality" in prompt.lower():
-            score = base_scores["code_quality"] + random.uniform(-0.3, 0.3)
-            return {
-                "score": round(score, 1),
-                "maintainability": 8,
-                "readability": 7,
-                "improvements": [
-                    {"title": "Increase test coverage to 80%+", "priority": "high"},
-                    {"title": "Add comprehensive documentation", "priority": "medium"},
-                    {"title": "Implement consistent error handling", "priority": "medium"},
-                    {"title": "Add code comments for complex logic", "priority": "low"}
-                ],
-                "strengths": [
-                    "Clean and readable code structure",
-                    "Consistent naming conventions",
-                    "Good separation of concerns",
-                    "Modular design approach"
-                ],
-                "weaknesses": [
-                    "Limited test coverage",
-                    "Missing documentation",
-                    "Inconsistent error handling",
-                    "Some complex functions need refactoring"
-                ],
-                "confidence": 0.8,  # Add confidence for fallback
-                "ai_analysis_available": True,
-                "timestamp": datetime.now().isoformat()
-            }
-        elif "performance" in prompt.lower():
-            score = base_scores["performance"] + random.uniform(-0.3, 0.3)
-            return {
-                "score": round(score, 1),
-                "bottlenecks": [
-                    "Database query optimization needed",
-                    "Large file processing could be async",
-                    "Memory usage in data processing"
-                ],
-                "recommendations": [
-                    "Implement database query optimization",
-                    "Use async operations for I/O bound tasks",
-                    "Add caching for frequently accessed data",
-                    "Optimize memory usage in large data processing"
-                ],
-                "confidence": 0.75,  # Add confidence for fallback
-                "ai_analysis_available": True,
-                "timestamp": datetime.now().isoformat()
-            }
-        elif "security" in prompt.lower():
-            risk_score = int(base_scores["security"] + random.uniform(-1, 1))
-            risk_score = max(1, min(5, risk_score))  # Keep within 1-5 range
-            return {
-                "risk_score": risk_score,
-                "vulnerabilities": [
-                    {"type": "Dependencies", "severity": "medium", "description": "Some outdated packages with known vulnerabilities"},
-                    {"type": "Input Validation", "severity": "low", "description": "Missing input sanitization in some endpoints"},
-                    {"type": "Authentication", "severity": "low", "description": "Token handling could be more secure"}
-                ],
-                "recommendations": [
-                    "Update all dependencies to latest secure versions",
-                    "Implement comprehensive input validation",
-                    "Add security headers to HTTP responses",
-                    "Use secure token storage practices",
-                    "Implement rate limiting for API endpoints"
-                ],
-                "confidence": 0.6,  # Add confidence for fallback
-                "ai_analysis_available": True,
-                "timestamp": datetime.now().isoformat()
-            }
-        else:
-            # Generic fallback for unknown analysis types
-            return {
-                "ai_analysis_available": True,
-                "score": 7.5,
-                "confidence": 0.5,  # Add confidence for fallback
-                "analysis_complete": True,
-                "timestamp": datetime.now().isoformat()
-            }
+            logger.error("❌ AI model call failed: %s, using fallback", e)
+            return None
+    
+    async def _read_streamed_content(self, response: aiohttp.ClientResponse) -> str:
+        """Accumulate streamed completion deltas until the answer's JSON value closes"""
+        scanner = _StreamingJsonScanner()
+        async for line in response.content:
+            line = line.strip()
+            if not line.startswith(b'data:'):
+                continue
+            event = line[5:].strip()
+            if event == b'[DONE]':
+                break
+            
+            choices = _json_loads(event).get('choices') or []
+            delta = choices[0].get('delta', {}).get('content') if choices else None
+            if delta and scanner.feed(delta):
+                # Anything the model writes after the JSON value is not needed
+                logger.debug("Streamed JSON answer complete after %d characters", len(scanner.text))
+                break
+        
+        return scanner.value_text
+    
+    def _get_fallback_response(self, analysis_type: str) -> Dict[str, Any]:
+        """Generate fallback response for the given analysis type"""
+        builder = _MOCK_RESPONSES.get(analysis_type, _mock_generic)
+        return builder(datetime.now().isoformat())
     
     def _fallback_analysis(self, analysis_type: str) -> Dict[str, Any]:
         """Fallback analysis when AI is not available"""
@@ -584,11 +1079,18 @@ class AIAnalyzer:
 class AIEnhancedIssueDetector:
     """Enhanced issue detector with AI capabilities"""
     
+    # Files sent per batched AI request, and AI requests allowed in flight at once. With the default
+    # file cap there is a single batch; the fan-out only matters when AI_MAX_CODE_FILES > FILES_PER_REQUEST
+    FILES_PER_REQUEST = 3
+    MAX_CONCURRENT_REQUESTS = max(1, Config.AI_MAX_CONCURRENCY)
+    # Each analyzed file costs model calls, so the cap is a cost setting
+    MAX_CODE_FILES = Config.AI_MAX_CODE_FILES
+    
     def __init__(self, ai_analyzer: AIAnalyzer):
         self.ai_analyzer = ai_analyzer
     
-    async def detect_comprehensive_issues(self, repo_path: str) -> Dict[str, Any]:
-        """Detect issues using AI analysis"""
+    async def detect_comprehensive_issues(self, repo_path: str, repo: Optional[str] = None) -> Dict[str, Any]:
+        """Detect issues using AI analysis; repo is the repository's full name, when known"""
         results = {
             "ai_analysis": {},
             "combined_score": 7.5,
@@ -597,58 +1099,94 @@ class AIEnhancedIssueDetector:
             "analysis_summary": {
                 "files_analyzed": 0,
                 "issues_found": 0,
-                "ai_available": bool(self.ai_analyzer.github_token)
+                "ai_available": self.ai_analyzer._available
             }
         }
         
-        # Get code files
-        code_files = self._get_code_files(repo_path)
-        results["analysis_summary"]["files_analyzed"] = len(code_files)
+        # The roadmap prompt does not depend on per-file results, so request it alongside them
+        roadmap_task = asyncio.create_task(
+            self.ai_analyzer.generate_improvement_roadmap(results["ai_analysis"])
+        )
+        try:
+            # Get code files without blocking the event loop on directory walks
+            code_files = await asyncio.to_thread(self._get_code_files, repo_path)
+            results["analysis_summary"]["files_analyzed"] = len(code_files)
+            
+            # Analyze files in batches, keeping a bounded number of requests in flight
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+            batches = [
+                code_files[i:i + self.FILES_PER_REQUEST]
+                for i in range(0, len(code_files), self.FILES_PER_REQUEST)
+            ]
+            for finished in asyncio.as_completed([self._analyze_batch(batch, semaphore, repo) for batch in batches]):
+                try:
+                    results["ai_analysis"].update(await finished)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning("⚠️ Error analyzing files: %s", e)
+        except BaseException:
+            roadmap_task.cancel()
+            raise
+        
+        results["improvement_roadmap"] = await roadmap_task
         
-        # Analyze a few key files
-        for file_path in code_files[:3]:  # Limit to 3 files
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()[:1000]  # Limit content
-                
-                language = self._detect_language(file_path)
-                ai_result = await self.ai_analyzer.analyze_code_quality(
-                    content, file_path, language
-                )
-                
-                results["ai_analysis"][file_path] = ai_result
-                
-            except Exception as e:
-                print(f"Error analyzing {file_path}: {e}")
+        return results
+    
+    async def _analyze_batch(self, file_paths: List[str], semaphore: asyncio.Semaphore,
+                             repo: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Read a batch of files and analyze them with one AI request"""
+        if not self.ai_analyzer._available:
+            # File contents are only needed for the model, so skip reading them
+            return {file_path: self.ai_analyzer._fallback_analysis("code_quality") for file_path in file_paths}
+        
+        contents = await asyncio.gather(
+            *(asyncio.to_thread(self._read_file_head, file_path) for file_path in file_paths),
+            return_exceptions=True
+        )
+        
+        batch = []
+        for file_path, content in zip(file_paths, contents):
+            if isinstance(content, Exception):
+                logger.warning("⚠️ Error reading %s: %s", file_path, content)
+                continue
+            if content is None:
                 continue
+            
+            batch.append((content, file_path, self._detect_language(file_path)))
         
-        # Generate roadmap
-        roadmap = await self.ai_analyzer.generate_improvement_roadmap(results["ai_analysis"])
-        results["improvement_roadmap"] = roadmap
+        if not batch:
+            return {}
         
-        return results
+        async with semaphore:
+            batch_results = await self.ai_analyzer.analyze_code_quality_batch(batch, repo)
+        
+        return {file_path: ai_result for (_, file_path, _), ai_result in zip(batch, batch_results)}
+    
+    def _read_file_head(self, file_path: str) -> Optional[str]:
+        """Read the leading part of a source file, or None if the file is empty"""
+        if os.stat(file_path).st_size == 0:
+            return None
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            return f.read(1000)  # Bounded read, independent of file size
     
     def _get_code_files(self, repo_path: str) -> List[str]:
         """Get code files from repository"""
-        code_extensions = {'.py', '.js', '.ts', '.java', '.cs'}
         code_files = []
         
         for root, dirs, files in os.walk(repo_path):
-            dirs[:] = [d for d in dirs if d not in {'.git', '__pycache__', 'node_modules'}]
+            dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
             
             for file in files:
-                if Path(file).suffix in code_extensions:
+                if file.endswith(_CODE_SUFFIXES):
                     code_files.append(os.path.join(root, file))
+                    # Stop walking once enough files are collected
+                    if len(code_files) >= self.MAX_CODE_FILES:
+                        return code_files
         
-        return code_files[:10]  # Limit files
+        return code_files
     
     def _detect_language(self, file_path: str) -> str:
         """Detect programming language"""
-        extension = Path(file_path).suffix
-        return {
-            '.py': 'python',
-            '.js': 'javascript', 
-            '.ts': 'typescript',
-            '.java': 'java',
-            '.cs': 'csharp'
-        }.get(extension, 'unknown')
\ No newline at end of file
+        dot = file_path.rfind('.')
+        return _LANG_MAP.get(file_path[dot:], 'unknown') if dot >= 0 else 'unknown'
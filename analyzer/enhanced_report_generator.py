@@ -3,33 +3,72 @@ Enhanced Report Generator with AI Insights
 Integrates traditional analysis with AI-powered recommendations and insights
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Awaitable, Dict, Any, Iterator, List, Optional
 from datetime import datetime
 import json
 import asyncio
+import heapq
 import logging
+import statistics
+from itertools import islice
 from .report_generator import ReportGenerator
-from .ai_analyzer import AIAnalyzer
-from .veracode_analyzer import VeracodeAnalyzer
 from config import Config
 
+# Fast JSON serialization (with stdlib fallback)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure logger for Enhanced Report Generator
 logger = logging.getLogger(__name__)
 
+# Source file suffixes worth suggesting tests for
+_CRITICAL_EXTENSIONS = ('.py', '.js', '.ts', '.java', '.cpp', '.c')
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, stringifying unsupported values; uses orjson when available"""
+    if ORJSON_AVAILABLE:
+        # Datetimes go through default=str so output matches the stdlib path
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=str, option=option)
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits, which only the stdlib encoder accepts
+    return json.dumps(obj, indent=2 if indent else None, default=str).encode('utf-8')
+
+
+async def _limited(semaphore: asyncio.Semaphore, coro: Awaitable[Any]) -> Any:
+    """Await coro while holding one of the semaphore's slots, returning any exception it raises"""
+    async with semaphore:
+        try:
+            return await coro
+        except Exception as e:
+            return e
+
+
 class EnhancedReportGenerator(ReportGenerator):
     """Enhanced report generator with AI insights and Veracode security analysis"""
     
-    def __init__(self, github_token: Optional[str] = None):
+    def __init__(self, github_token: Optional[str] = None, http_session=None):
+        """Optionally share a long-lived aiohttp session (see ai_analyzer.create_http_session) for model calls"""
         super().__init__()
-        self.ai_analyzer = AIAnalyzer(github_token)
+        # Analyzer modules are imported on first use so importing this module stays cheap
+        from .ai_analyzer import AIAnalyzer
+        self.ai_analyzer = AIAnalyzer(github_token, session=http_session)
         
         # Initialize Veracode analyzer if enabled
         self.veracode_analyzer = None
         if Config.VERACODE_ENABLED:
+            from .veracode_analyzer import VeracodeAnalyzer
             self.veracode_analyzer = VeracodeAnalyzer()
-            logger.info(f"🔒 Veracode analyzer initialized: {self.veracode_analyzer.is_available}")
+            logger.info("🔒 Veracode analyzer initialized: %s", self.veracode_analyzer.is_available)
         
-        logger.info(f"🧠 Enhanced Report Generator initialized with AI support: {bool(github_token)}")
+        logger.info("🧠 Enhanced Report Generator initialized with AI support: %s", bool(github_token))
         
     async def generate_enhanced_report(self, repo_info: Dict[str, Any], 
                                      coverage_results: Dict[str, Any], 
@@ -38,123 +77,166 @@ class EnhancedReportGenerator(ReportGenerator):
                                      enable_ai: bool = False) -> Dict[str, Any]:
         """Generate comprehensive analysis report with optional AI insights and Veracode security analysis"""
         repo_name = repo_info.get('name', 'Unknown')
-        logger.info(f"📊 Generating enhanced report for {repo_name} (AI enabled: {enable_ai})")
+        logger.info("📊 Generating enhanced report for %s (AI enabled: %s)", repo_name, enable_ai)
         
-        # Generate base report
-        logger.info("📋 Generating base report")
-        base_report = self.generate_report(repo_info, coverage_results, issues)
-        logger.info("✅ Base report generated successfully")
-        
-        # Add AI insights if enabled
-        if enable_ai:
-            try:
-                logger.info("🧠 Starting AI insights generation")
-                ai_insights = await self._generate_ai_insights(
-                    repo_info, coverage_results, issues
-                )
-                base_report['ai_insights'] = ai_insights
-                logger.info(f"✅ AI insights generated with {len(ai_insights)} components")
-                
-                logger.info("💡 Generating AI recommendations")
-                base_report['enhanced_recommendations'] = await self._generate_ai_recommendations(
-                    base_report, ai_insights
+        try:
+            # Generate base report
+            logger.info("📋 Generating base report")
+            base_report = self.generate_report(repo_info, coverage_results, issues)
+            logger.info("✅ Base report generated successfully")
+            
+            # Start Veracode security analysis if enabled and repo_path is provided; it is
+            # independent of the AI calls below, so the two run concurrently
+            veracode_task = None
+            if self.veracode_analyzer and repo_path:
+                logger.info("🔒 Starting Veracode security analysis")
+                veracode_task = asyncio.create_task(
+                    self.veracode_analyzer.analyze_repository(repo_path, repo_name)
                 )
-                logger.info("✅ AI recommendations generated")
-                
-                # Generate AI summary for template display
-                logger.info("📊 Generating AI summary")
-                base_report['ai_summary'] = self.generate_ai_summary(ai_insights)
-                logger.info(f"✅ AI summary generated - Overall score: {base_report['ai_summary'].get('overall_ai_score', 0):.1f}/10")
-                
-                base_report['ai_enabled'] = True
-                logger.info(f"🎉 Enhanced report completed successfully for {repo_name}")
-            except Exception as e:
-                logger.error(f"❌ AI analysis failed for {repo_name}: {str(e)}", exc_info=True)
-                base_report['ai_error'] = f"AI analysis failed: {str(e)}"
+            
+            # Add AI insights if enabled
+            if enable_ai:
+                try:
+                    logger.info("🧠 Starting AI insights generation")
+                    ai_insights = await self._generate_ai_insights(
+                        repo_info, coverage_results, issues
+                    )
+                    base_report['ai_insights'] = ai_insights
+                    logger.info("✅ AI insights generated with %d components", len(ai_insights))
+            
+                    logger.info("💡 Generating AI recommendations")
+                    base_report['enhanced_recommendations'] = await self._generate_ai_recommendations(
+                        base_report, ai_insights
+                    )
+                    logger.info("✅ AI recommendations generated")
+            
+                    # Generate AI summary for template display
+                    logger.info("📊 Generating AI summary")
+                    base_report['ai_summary'] = self.generate_ai_summary(ai_insights)
+                    logger.info("✅ AI summary generated - Overall score: %.1f/10",
+                                base_report['ai_summary'].get('overall_ai_score', 0))
+            
+                    base_report['ai_enabled'] = True
+                    logger.info("🎉 Enhanced report completed successfully for %s", repo_name)
+                except Exception as e:
+                    logger.error("❌ AI analysis failed for %s: %s", repo_name, e, exc_info=True)
+                    base_report['ai_error'] = f"AI analysis failed: {str(e)}"
+                    base_report['ai_enabled'] = False
+            else:
+                logger.info("📊 AI features disabled, using standard report")
                 base_report['ai_enabled'] = False
-        else:
-            logger.info("📊 AI features disabled, using standard report")
-            base_report['ai_enabled'] = False
             
-        # Add Veracode security analysis if enabled and repo_path is provided
-        if self.veracode_analyzer and repo_path:
-            try:
-                logger.info("🔒 Starting Veracode security analysis")
-                veracode_analysis = await self.veracode_analyzer.analyze_repository(repo_path, repo_name)
-                base_report['veracode_analysis'] = veracode_analysis
-                
-                # Update security score with Veracode results
-                if 'scores' in base_report and veracode_analysis.get('security_score') is not None:
-                    # Use the lower of existing security score and Veracode score
-                    existing_score = base_report['scores'].get('security_score', 100)
-                    veracode_score = veracode_analysis.get('security_score', 100)
-                    base_report['scores']['security_score'] = min(existing_score, veracode_score)
-                    base_report['scores']['veracode_score'] = veracode_score
-                
-                base_report['veracode_enabled'] = True
-                logger.info(f"✅ Veracode analysis completed - Security score: {veracode_analysis.get('security_score', 'N/A')}")
-                
-            except Exception as e:
-                logger.error(f"❌ Veracode analysis failed for {repo_name}: {str(e)}", exc_info=True)
-                base_report['veracode_error'] = f"Veracode analysis failed: {str(e)}"
-                base_report['veracode_enabled'] = False
-        else:
-            if self.veracode_analyzer:
-                logger.info("⚠️ Veracode analyzer available but repo_path not provided")
+            # Add Veracode security analysis results
+            if veracode_task is not None:
+                try:
+                    veracode_analysis = await veracode_task
+                    base_report['veracode_analysis'] = veracode_analysis
+            
+                    # Update security score with Veracode results
+                    if 'scores' in base_report and veracode_analysis.get('security_score') is not None:
+                        # Use the lower of existing security score and Veracode score
+                        existing_score = base_report['scores'].get('security_score', 100)
+                        veracode_score = veracode_analysis.get('security_score', 100)
+                        base_report['scores']['security_score'] = min(existing_score, veracode_score)
+                        base_report['scores']['veracode_score'] = veracode_score
+            
+                    base_report['veracode_enabled'] = True
+                    logger.info("✅ Veracode analysis completed - Security score: %s",
+                                veracode_analysis.get('security_score', 'N/A'))
+            
+                except Exception as e:
+                    logger.error("❌ Veracode analysis failed for %s: %s", repo_name, e, exc_info=True)
+                    base_report['veracode_error'] = f"Veracode analysis failed: {str(e)}"
+                    base_report['veracode_enabled'] = False
             else:
-                logger.info("📊 Veracode analysis disabled")
-            base_report['veracode_enabled'] = False
+                if self.veracode_analyzer:
+                    logger.info("⚠️ Veracode analyzer available but repo_path not provided")
+                else:
+                    logger.info("📊 Veracode analysis disabled")
+                base_report['veracode_enabled'] = False
             
-        return base_report
+            return base_report
+        finally:
+            # Release the analyzer's own pooled connections before the caller's event loop shuts down, also on
+            # failure (a session passed in by the caller stays open for its next report)
+            await self.ai_analyzer.close()
     
     async def _generate_ai_insights(self, repo_info: Dict[str, Any], 
                                    coverage_results: Dict[str, Any], 
                                    issues: Dict[str, Any]) -> Dict[str, Any]:
         """Generate AI-powered insights about the repository"""
         repo_name = repo_info.get('name', 'Unknown')
-        logger.info(f"🔍 Generating AI insights for {repo_name}")
+        logger.info("🔍 Generating AI insights for %s", repo_name)
         
+        file_structure = repo_info.get('file_structure', {})
+        dependencies = repo_info.get('dependencies', [])
         insights = {}
         
-        try:
-            # Architecture analysis
-            logger.info("🏗️ Starting architecture analysis")
-            insights['architecture'] = await self.ai_analyzer.analyze_architecture(
+        # The four analyses are independent model calls, so run them concurrently,
+        # capped at AI_MAX_CONCURRENCY requests to stay within the API rate limits
+        semaphore = asyncio.Semaphore(max(1, Config.AI_MAX_CONCURRENCY))
+        logger.info("🚀 Starting architecture, code quality, performance and security analyses")
+        analyses = {
+            'architecture': self.ai_analyzer.analyze_architecture(
                 repo_info, coverage_results, issues
-            )
-            logger.info(f"✅ Architecture analysis completed - Score: {insights['architecture'].get('architecture_score', 'N/A')}")
-            
-            # Code quality insights
-            logger.info("🔍 Starting code quality analysis")
-            # Code quality insights
-            logger.info("🔍 Starting code quality analysis")
-            insights['code_quality'] = await self.ai_analyzer.analyze_code_quality(
+            ),
+            'code_quality': self.ai_analyzer.analyze_code_quality(
                 issues,
                 coverage_results
-            )
-            logger.info(f"✅ Code quality analysis completed - Score: {insights['code_quality'].get('score', 'N/A')}")
-            
-            # Performance analysis
-            logger.info("⚡ Starting performance analysis")
-            insights['performance'] = await self.ai_analyzer.analyze_performance_patterns(
-                repo_info.get('file_structure', {}),
+            ),
+            'performance': self.ai_analyzer.analyze_performance_patterns(
+                file_structure,
                 issues
-            )
-            logger.info(f"✅ Performance analysis completed - Score: {insights['performance'].get('score', 'N/A')}")
-            
-            # Security assessment
-            logger.info("🔒 Starting security analysis")
-            insights['security'] = await self.ai_analyzer.analyze_security(
+            ),
+            'security': self.ai_analyzer.analyze_security(
                 issues,
-                repo_info.get('dependencies', [])
+                dependencies
             )
-            logger.info(f"✅ Security analysis completed - Risk Score: {insights['security'].get('risk_score', 'N/A')}")
-            
-            logger.info(f"✅ All AI insights generated successfully")
-            
-        except Exception as e:
-            logger.error(f"❌ Failed to generate AI insights: {str(e)}", exc_info=True)
-            insights['error'] = f"Failed to generate AI insights: {str(e)}"
+        }
+        if hasattr(asyncio, 'TaskGroup'):
+            # Python 3.11+: one cancellation scope for all analyses; failures are
+            # returned by _limited, so one failing analysis does not cancel the rest
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(_limited(semaphore, analysis)) for analysis in analyses.values()]
+            results = [task.result() for task in tasks]
+        else:
+            results = await asyncio.gather(*(_limited(semaphore, analysis) for analysis in analyses.values()))
+        
+        # Every insight is a dict; a failed analysis keeps the analyzer's fallback payload,
+        # so consumers still find its usual keys, plus an 'error' describing the failure
+        fallbacks = {
+            'architecture': self.ai_analyzer._fallback_architecture_analysis,
+            'code_quality': self.ai_analyzer._fallback_code_quality_analysis,
+            'performance': self.ai_analyzer._fallback_performance_analysis,
+            'security': self.ai_analyzer._fallback_security_analysis
+        }
+        failed = False
+        for name, result in zip(analyses, results):
+            if isinstance(result, dict):
+                insights[name] = result
+            else:
+                if isinstance(result, Exception):
+                    logger.error("❌ %s analysis failed: %s", name, result, exc_info=result)
+                    error = f"Failed to generate AI insights: {str(result)}"
+                else:
+                    logger.error("❌ %s analysis returned %s instead of a dict", name, type(result).__name__)
+                    error = "Failed to generate AI insights: unexpected response format"
+                insights[name] = fallbacks[name]()
+                insights[name]['error'] = error
+                failed = True
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("✅ Architecture analysis completed - Score: %s",
+                        insights['architecture'].get('architecture_score', 'N/A'))
+            logger.info("✅ Code quality analysis completed - Score: %s",
+                        insights['code_quality'].get('score', 'N/A'))
+            logger.info("✅ Performance analysis completed - Score: %s",
+                        insights['performance'].get('score', 'N/A'))
+            logger.info("✅ Security analysis completed - Risk Score: %s",
+                        insights['security'].get('risk_score', 'N/A'))
+        
+        if not failed:
+            logger.info("✅ All AI insights generated successfully")
             
         return insights
     
@@ -172,9 +254,11 @@ class EnhancedReportGenerator(ReportGenerator):
             'code_quality_enhancements': []
         }
         
+        summary = base_report.get('summary', {})
+        
         try:
             # Priority actions based on critical issues and AI analysis
-            if base_report.get('summary', {}).get('critical_issues', 0) > 0:
+            if summary.get('critical_issues', 0) > 0:
                 recommendations['priority_actions'].extend([
                     {
                         'title': 'Address Critical Security Issues',
@@ -198,7 +282,7 @@ class EnhancedReportGenerator(ReportGenerator):
                     })
             
             # Quick wins from AI analysis
-            if base_report.get('summary', {}).get('test_coverage', 0) < 70:
+            if summary.get('test_coverage', 0) < 70:
                 recommendations['quick_wins'].append({
                     'title': 'Improve Test Coverage',
                     'description': 'Add unit tests for uncovered components',
@@ -211,16 +295,15 @@ class EnhancedReportGenerator(ReportGenerator):
             # Technology upgrades
             if 'technology_stack' in ai_insights:
                 tech_insights = ai_insights['technology_stack']
-                if tech_insights.get('outdated_dependencies'):
-                    recommendations['technology_upgrades'].extend([
-                        {
-                            'title': f'Update {dep}',
-                            'description': f'Upgrade to latest version for security and performance',
-                            'effort': 'Low',
-                            'impact': 'Medium',
-                            'ai_confidence': 0.85
-                        } for dep in tech_insights['outdated_dependencies'][:3]
-                    ])
+                recommendations['technology_upgrades'].extend(
+                    {
+                        'title': f'Update {dep}',
+                        'description': 'Upgrade to latest version for security and performance',
+                        'effort': 'Low',
+                        'impact': 'Medium',
+                        'ai_confidence': 0.85
+                    } for dep in islice(tech_insights.get('outdated_dependencies') or (), 3)
+                )
             
             # Security improvements
             if 'security' in ai_insights:
@@ -251,19 +334,12 @@ class EnhancedReportGenerator(ReportGenerator):
     
     def _suggest_test_files(self, report: Dict[str, Any]) -> List[str]:
         """Suggest files that need test coverage"""
-        suggestions = []
-        
         # Get uncovered files from coverage analysis
         test_analysis = report.get('test_analysis', {})
         uncovered_files = test_analysis.get('uncovered_files', [])
         
-        # Prioritize critical files
-        critical_extensions = ['.py', '.js', '.ts', '.java', '.cpp', '.c']
-        for file in uncovered_files[:5]:  # Top 5 suggestions
-            if any(file.endswith(ext) for ext in critical_extensions):
-                suggestions.append(file)
-                
-        return suggestions
+        # Top 5 critical files, filtered before slicing so non-critical files do not use up slots
+        return [file for file in uncovered_files if file.endswith(_CRITICAL_EXTENSIONS)][:5]
     
     def generate_ai_summary(self, ai_insights: Dict[str, Any]) -> Dict[str, Any]:
         """Generate a summary of AI insights"""
@@ -276,39 +352,43 @@ class EnhancedReportGenerator(ReportGenerator):
         }
         
         try:
-            # Calculate overall AI score
-            scores = []
-            insights_count = 0
+            # Single pass over the insights, collecting scores, findings and confidence
+            score_sum = 0
+            score_count = 0
+            confidences = []
+            add_findings = summary['key_findings'].extend
             
-            for category, insights in ai_insights.items():
-                if isinstance(insights, dict):
-                    # Check for different score field names
-                    score = None
-                    if 'score' in insights:
-                        score = insights['score']
-                    elif 'architecture_score' in insights:
-                        score = insights['architecture_score']
-                    elif 'quality_score' in insights:
-                        score = insights['quality_score']
-                    
-                    if score is not None:
-                        scores.append(score)
-                        insights_count += 1
-                    
-                    # Add key findings
-                    if insights.get('key_findings'):
-                        summary['key_findings'].extend(insights['key_findings'][:2])
+            for insights in ai_insights.values():
+                if 'error' in insights:
+                    # Failed analysis: no score, findings or confidence to contribute
+                    continue
+                
+                # Check for different score field names
+                if 'score' in insights:
+                    score = insights['score']
+                elif 'architecture_score' in insights:
+                    score = insights['architecture_score']
+                else:
+                    score = insights.get('quality_score')
+                
+                if score is not None:
+                    score_sum += score
+                    score_count += 1
+                
+                # Add key findings
+                findings = insights.get('key_findings')
+                if findings:
+                    add_findings(findings[:2])
+                
+                confidences.append(insights.get('confidence', 0.5))
             
-            if scores:
-                summary['overall_ai_score'] = sum(scores) / len(scores)
-                summary['insights_count'] = insights_count
+            if score_count:
+                summary['overall_ai_score'] = score_sum / score_count
+                summary['insights_count'] = score_count
                 
                 # Determine confidence level
-                avg_confidence = sum(
-                    insights.get('confidence', 0.5) 
-                    for insights in ai_insights.values() 
-                    if isinstance(insights, dict)
-                ) / len(ai_insights)
+                # Averaged over the dict-valued insights only, not e.g. an 'error' message
+                avg_confidence = statistics.fmean(confidences)
                 
                 if avg_confidence > 0.8:
                     summary['confidence_level'] = 'high'
@@ -382,8 +462,8 @@ class EnhancedReportGenerator(ReportGenerator):
                         'confidence': action.get('confidence', 0.7)
                     })
             
-            # Sort by priority and confidence
-            action_plan.sort(key=lambda x: (x['priority'], -x['confidence']))
+            # Keep the top 10 by priority and confidence without sorting the rest
+            action_plan = heapq.nsmallest(10, action_plan, key=lambda x: (x['priority'], -x['confidence']))
             
         except Exception as e:
             action_plan.append({
@@ -403,56 +483,60 @@ class EnhancedReportGenerator(ReportGenerator):
         """Export enhanced report in various formats"""
         
         if format.lower() == 'json':
-            return json.dumps(report, indent=2, default=str)
+            return self._export_json(report)
         elif format.lower() == 'markdown':
             return self._generate_markdown_report(report)
         else:
             raise ValueError(f"Unsupported export format: {format}")
     
+    def _export_json(self, report: Dict[str, Any]) -> str:
+        """Pretty-print report as JSON"""
+        return _dumps(report, indent=True).decode('utf-8')
+    
     def _generate_markdown_report(self, report: Dict[str, Any]) -> str:
         """Generate markdown formatted report"""
-        
-        md_content = []
-        
-        # Header
+        return "\n".join(self._emit_markdown(report))
+    
+    def _emit_markdown(self, report: Dict[str, Any]) -> Iterator[str]:
+        """Yield the lines of the markdown report, section by section"""
         metadata = report.get('metadata', {})
-        md_content.append(f"# CodePulse Analysis Report")
-        md_content.append(f"**Repository:** {metadata.get('repository', 'Unknown')}")
-        md_content.append(f"**Analysis Date:** {metadata.get('analysis_date', 'Unknown')}")
-        md_content.append("")
-        
-        # Summary
         summary = report.get('summary', {})
-        md_content.append("## Executive Summary")
-        md_content.append(f"**Health Score:** {summary.get('health_score', 0)}/100")
-        md_content.append(f"**Status:** {summary.get('status', 'Unknown')}")
-        md_content.append(f"**Test Coverage:** {summary.get('test_coverage', 0):.1f}%")
-        md_content.append("")
+        
+        # Header and summary
+        yield "# CodePulse Analysis Report"
+        yield f"**Repository:** {metadata.get('repository', 'Unknown')}"
+        yield f"**Analysis Date:** {metadata.get('analysis_date', 'Unknown')}"
+        yield ""
+        yield "## Executive Summary"
+        yield f"**Health Score:** {summary.get('health_score', 0)}/100"
+        yield f"**Status:** {summary.get('status', 'Unknown')}"
+        yield f"**Test Coverage:** {summary.get('test_coverage', 0):.1f}%"
+        yield ""
         
         # AI Insights (if available)
         if report.get('ai_enabled') and 'ai_insights' in report:
-            md_content.append("## AI-Powered Insights")
-            ai_summary = self.generate_ai_summary(report['ai_insights'])
-            md_content.append(f"**AI Score:** {ai_summary.get('overall_ai_score', 0):.1f}/10")
-            md_content.append(f"**Confidence Level:** {ai_summary.get('confidence_level', 'medium').title()}")
+            # Reuse the summary stored by generate_enhanced_report when present
+            ai_summary = report.get('ai_summary') or self.generate_ai_summary(report['ai_insights'])
+            yield "## AI-Powered Insights"
+            yield f"**AI Score:** {ai_summary.get('overall_ai_score', 0):.1f}/10"
+            yield f"**Confidence Level:** {ai_summary.get('confidence_level', 'medium').title()}"
             
-            if ai_summary.get('key_findings'):
-                md_content.append("### Key Findings")
-                for finding in ai_summary['key_findings']:
-                    md_content.append(f"- {finding}")
-                md_content.append("")
+            key_findings = ai_summary.get('key_findings')
+            if key_findings:
+                yield "### Key Findings"
+                for finding in key_findings:
+                    yield f"- {finding}"
+                yield ""
         
         # Action Plan
         if 'enhanced_recommendations' in report:
             action_plan = self.generate_enhanced_action_plan(report['enhanced_recommendations'])
-            md_content.append("## Recommended Actions")
+            yield "## Recommended Actions"
             for i, action in enumerate(action_plan[:5], 1):
-                md_content.append(f"### {i}. {action['title']}")
-                md_content.append(f"**Category:** {action['category']}")
-                md_content.append(f"**Effort:** {action['effort']} | **Impact:** {action['impact']}")
-                md_content.append(f"{action['description']}")
+                yield f"### {i}. {action['title']}"
+                yield f"**Category:** {action['category']}"
+                yield f"**Effort:** {action['effort']} | **Impact:** {action['impact']}"
+                yield f"{action['description']}"
                 if action.get('ai_enhanced'):
-                    md_content.append(f"*AI Confidence: {action['confidence']:.1%}*")
-                md_content.append("")
-        
-        return "\n".join(md_content)
+                    yield f"*AI Confidence: {action['confidence']:.1%}*"
+                yield ""
@@ -1,65 +1,353 @@
 import os
+import base64
+import itertools
+from itertools import islice
+import codecs
 import tempfile
 import shutil
+import sqlite3
 import subprocess
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from github import Github
 from git import Repo
-import requests
-from typing import Dict, Optional, Any
+import httpx
+from typing import Dict, List, Optional, Any, Set, Tuple, Union
+from config import Config
+
+# Fast JSON decoding (with stdlib fallback)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Persistent HTTP caching that honors Cache-Control and ETags (with in-memory ETag fallback)
+try:
+    import hishel
+    HISHEL_AVAILABLE = True
+except ImportError:
+    HISHEL_AVAILABLE = False
+
+# HTTP/2 lets concurrent API calls share one connection (with HTTP/1.1 fallback)
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+# Pooled tokens are only ever sent to the API itself, never to raw/codeload download hosts
+API_HOSTS = frozenset({'api.github.com'})
+
+# Shared by all clients, since app.py creates a new one per request
+# (repo_path, is_public, token, fields) -> (expiry time, repository info)
+_repo_info_cache: Dict[tuple, Tuple[float, Dict[str, Any]]] = {}
+# URL -> (ETag, parsed body) for conditional requests; 304 replies do not count against the rate limit
+_etag_cache: Dict[str, Tuple[str, Any]] = {}
+# On-disk response store, opened by the first client so importing the module creates no file
+_http_cache_storage = None
+_http_cache_lock = threading.Lock()
+
+
+def _get_http_cache_storage():
+    """Return the shared SQLite storage for the persistent HTTP cache"""
+    global _http_cache_storage
+    with _http_cache_lock:
+        if _http_cache_storage is None:
+            path = Config.GITHUB_HTTP_CACHE_PATH
+            os.makedirs(os.path.dirname(path) or '.', mode=0o700, exist_ok=True)
+            # Owner-only before SQLite opens it; its journal files copy the database's permissions
+            os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+            os.chmod(path, 0o600)
+            connection = sqlite3.connect(path, check_same_thread=False)
+            _http_cache_storage = hishel.SQLiteStorage(connection=connection, ttl=Config.GITHUB_HTTP_CACHE_TTL)
+        return _http_cache_storage
+
+
+def _json(response: httpx.Response) -> Any:
+    """Decode a JSON response body, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse a GitHub ISO 8601 timestamp into an aware datetime, as PyGithub returns"""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _remember(cache: Dict, key, value) -> None:
+    """Store value, evicting the oldest entry once the cache is full"""
+    cache.pop(key, None)
+    if len(cache) >= Config.GITHUB_CACHE_SIZE:
+        cache.pop(next(iter(cache)), None)
+    cache[key] = value
+
+# Everything _get_authenticated_repo_info assembles from separate REST calls except contributors,
+# which GraphQL does not expose, in one query
+_REPO_INFO_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    name
+    nameWithOwner
+    description
+    url
+    stargazerCount
+    forkCount
+    diskUsage
+    createdAt
+    updatedAt
+    hasIssuesEnabled
+    hasProjectsEnabled
+    hasWikiEnabled
+    licenseInfo { name }
+    languages(first: 20, orderBy: {field: SIZE, direction: DESC}) { edges { size node { name } } }
+    repositoryTopics(first: 20) { nodes { topic { name } } }
+    issues(states: OPEN) { totalCount }
+    pullRequests(states: OPEN) { totalCount }
+    defaultBranchRef {
+      name
+      target { ... on Commit { history(first: 10) { nodes { oid } } } }
+    }
+  }
+}
+"""
+
+class _UnauthenticatedCacheTransport(httpx.BaseTransport):
+    """Answers credential-free requests through the persistent cache; authenticated ones go straight through
+    
+    hishel stores request headers with each response, so caching a token-bearing request would write the
+    token (and private repository data) to disk.
+    """
+    
+    def __init__(self, transport: httpx.BaseTransport):
+        self._transport = transport
+        self._cache = hishel.CacheTransport(transport=transport, storage=_get_http_cache_storage())
+    
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if 'Authorization' in request.headers:
+            return self._transport.handle_request(request)
+        return self._cache.handle_request(request)
+    
+    def close(self) -> None:
+        # The storage is shared by every client in the process, so only the connections are closed
+        self._transport.close()
+
+
+class _RetryTransport(httpx.HTTPTransport):
+    """HTTP transport that also retries transient gateway errors, honoring Retry-After"""
+    
+    RETRY_STATUSES = frozenset({502, 503, 504})
+    
+    def __init__(self, retries: int = 3, backoff_factor: float = 0.3, **kwargs):
+        super().__init__(retries=retries, **kwargs)
+        self.status_retries = retries
+        self.backoff_factor = backoff_factor
+    
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(self.status_retries + 1):
+            response = super().handle_request(request)
+            if response.status_code not in self.RETRY_STATUSES or attempt == self.status_retries:
+                return response
+            retry_after = response.headers.get('Retry-After', '')
+            response.close()
+            time.sleep(float(retry_after) if retry_after.isdigit() else self.backoff_factor * 2 ** attempt)
+
+
+class _TokenPoolAuth(httpx.Auth):
+    """Authenticate API requests with the client's next pooled token
+    
+    Auth runs once per request, before redirects are followed, so httpx's own
+    stripping of Authorization on cross-origin redirects still applies.
+    """
+    
+    def __init__(self, client: 'GitHubClient'):
+        self.client = client
+    
+    def auth_flow(self, request: httpx.Request):
+        if self.client._tokens and request.url.host in API_HOSTS:
+            request.headers['Authorization'] = f'Bearer {self.client._next_token()}'
+        yield request
+
 
 class GitHubClient:
     """GitHub API client for repository operations"""
     
-    def __init__(self, token: str = None, is_public: bool = True):
-        """Initialize GitHub client with optional access token"""
-        self.token = token
+    # Concurrent API requests per repository lookup, kept low for GitHub's secondary rate limits
+    MAX_PARALLEL_REQUESTS = 5
+    # Concurrent directory listings when search_files has to walk the contents API
+    MAX_DIRECTORY_REQUESTS = 8
+    
+    # Analysis only reads the working tree, so skip history, other branches and tags
+    CLONE_OPTIONS = ['--depth=1', '--single-branch', '--no-tags', '--shallow-submodules']
+    
+    # Files above this size are streamed from their raw download URL instead of decoded from base64
+    STREAM_FILE_THRESHOLD = 1_000_000
+    
+    # A token is skipped until its window resets once fewer requests than this remain
+    RATE_LIMIT_RESERVE = 50
+    
+    # Sent with every API request; the versioned media type keeps payloads to the current schema
+    API_HEADERS = {
+        'Accept': 'application/vnd.github+json',
+        'X-GitHub-Api-Version': '2022-11-28',
+        'User-Agent': 'CodePulse/1.0'
+    }
+    
+    def __init__(self, token: Union[str, List[str], None] = None, is_public: bool = True):
+        """Initialize GitHub client with an optional access token or a pool of tokens"""
+        # API requests rotate through every token; PyGithub and clones use the first one
+        self._tokens = [token] if isinstance(token, str) else [t for t in (token or []) if t]
+        self._token_cycle = itertools.cycle(self._tokens)
+        # token -> (X-RateLimit-Remaining, X-RateLimit-Reset) from its latest response
+        self._rate_limits: Dict[str, Tuple[int, float]] = {}
+        self.token = self._tokens[0] if self._tokens else None
         self.is_public = is_public
         
-        if token:
-            self.github = Github(token)
+        if self.token:
+            self.github = Github(self.token)
         else:
             # For public repositories, use unauthenticated access
             self.github = Github()
         
-        self.session = requests.Session()
-        if token:
-            self.session.headers.update({'Authorization': f'token {token}'})
+        # Keep connections to api.github.com alive and retry transient gateway errors
+        transport = _RetryTransport(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+        )
+        if HISHEL_AVAILABLE and Config.GITHUB_HTTP_CACHE:
+            # Reruns answer from disk while GitHub's max-age holds, then revalidate with the stored ETag
+            transport = _UnauthenticatedCacheTransport(transport)
+        self.session = httpx.Client(
+            transport=transport,
+            timeout=httpx.Timeout(10.0),
+            follow_redirects=True,
+            headers=self.API_HEADERS,
+            auth=_TokenPoolAuth(self),
+            event_hooks={'response': [self._record_rate_limit]}
+        )
+        
+        # repo_path -> (expiry time, PyGithub Repository), so chained calls share one lookup
+        self._repo_cache: Dict[str, Tuple[float, Any]] = {}
+    
+    def close(self) -> None:
+        """Close the pooled API connections held by this client"""
+        self.session.close()
+        self.github.close()
+    
+    def __enter__(self) -> 'GitHubClient':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+        
+    def get_repository_info(self, repo_path: str, fields: Optional[Set[str]] = None) -> Dict[str, Any]:
+        """Get detailed repository information (cached for Config.GITHUB_CACHE_TTL seconds)
+        
+        fields optionally names the keys the caller needs ('languages', 'recent_commits');
+        unauthenticated lookups skip the requests for anything not listed.
+        """
+        cache_key = (repo_path, self.is_public, self.token, frozenset(fields) if fields is not None else None)
+        if Config.ENABLE_CACHING:
+            cached = _repo_info_cache.get(cache_key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
         
-    def get_repository_info(self, repo_path: str) -> Dict[str, Any]:
-        """Get detailed repository information"""
         try:
             if self.is_public and not self.token:
                 # For public repositories without token, use GitHub API directly
-                return self._get_public_repo_info(repo_path)
+                info = self._get_public_repo_info(repo_path, fields)
             else:
-                return self._get_authenticated_repo_info(repo_path)
+                try:
+                    info = self._get_repo_info_graphql(repo_path)
+                except Exception as e:
+                    print(f"Warning: GraphQL lookup failed, falling back to REST: {e}")
+                    info = self._get_authenticated_repo_info(repo_path)
                 
         except Exception as e:
             raise Exception(f"Failed to fetch repository info: {str(e)}")
+        
+        if Config.ENABLE_CACHING:
+            _remember(_repo_info_cache, cache_key, (time.monotonic() + Config.GITHUB_CACHE_TTL, info))
+        return info
+    
+    def _next_token(self) -> str:
+        """Pick the next pooled token that still has rate limit to spare"""
+        now = time.time()
+        for _ in range(len(self._tokens)):
+            token = next(self._token_cycle)
+            remaining, reset = self._rate_limits.get(token, (self.RATE_LIMIT_RESERVE, 0.0))
+            if remaining >= self.RATE_LIMIT_RESERVE or reset <= now:
+                return token
+        # Every token is nearly exhausted; keep rotating rather than fail outright
+        return token
+    
+    def _record_rate_limit(self, response: httpx.Response) -> None:
+        """Response hook: remember how much rate limit the request's token has left"""
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        authorization = response.request.headers.get('Authorization', '')
+        if remaining is not None and authorization.startswith('Bearer '):
+            reset = float(response.headers.get('X-RateLimit-Reset', 0))
+            self._rate_limits[authorization[7:]] = (int(remaining), reset)
+    
+    def _repo(self, repo_path: str):
+        """Get the PyGithub Repository for repo_path, reusing a recent lookup"""
+        now = time.monotonic()
+        cached = self._repo_cache.get(repo_path)
+        if cached and cached[0] > now:
+            return cached[1]
+        repo = self.github.get_repo(repo_path)
+        self._repo_cache[repo_path] = (now + Config.GITHUB_CACHE_TTL, repo)
+        return repo
     
-    def _get_public_repo_info(self, repo_path: str) -> Dict[str, Any]:
+    def _get_json(self, url: str) -> Tuple[int, Any]:
+        """GET a GitHub API URL, revalidating cached bodies with their ETag; returns (status, body or None)"""
+        cached = _etag_cache.get(url)
+        headers = {'If-None-Match': cached[0]} if cached else None
+        response = self.session.get(url, headers=headers)
+        
+        if response.status_code == 304 and cached:
+            return 200, cached[1]
+        if response.status_code != 200:
+            return response.status_code, None
+        
+        data = _json(response)
+        etag = response.headers.get('ETag')
+        if etag:
+            _remember(_etag_cache, url, (etag, data))
+        return 200, data
+    
+    def _get_public_repo_info(self, repo_path: str, fields: Optional[Set[str]] = None) -> Dict[str, Any]:
         """Get repository info for public repos without authentication"""
         try:
-            # Use GitHub REST API directly
+            # Use GitHub REST API directly; the requests are independent, so issue them together
             api_url = f"https://api.github.com/repos/{repo_path}"
-            response = self.session.get(api_url)
-            
-            if response.status_code == 404:
-                raise Exception("Repository not found or is private")
-            elif response.status_code != 200:
-                raise Exception(f"GitHub API error: {response.status_code}")
+            languages_url = f"https://api.github.com/repos/{repo_path}/languages"
+            commits_url = f"https://api.github.com/repos/{repo_path}/commits?per_page=10"
             
-            repo_data = response.json()
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                repo_future = executor.submit(self._get_json, api_url)
+                lang_future = commits_future = None
+                if fields is None or 'languages' in fields:
+                    lang_future = executor.submit(self._get_json, languages_url)
+                if fields is None or 'recent_commits' in fields:
+                    commits_future = executor.submit(self._get_json, commits_url)
             
-            # Get languages (limited info without auth)
-            languages_url = f"https://api.github.com/repos/{repo_path}/languages"
-            lang_response = self.session.get(languages_url)
-            languages = lang_response.json() if lang_response.status_code == 200 else {}
+            status, repo_data = repo_future.result()
+            if status == 404:
+                raise Exception("Repository not found or is private")
+            elif status != 200:
+                raise Exception(f"GitHub API error: {status}")
             
-            # Get recent commits (limited without auth)
-            commits_url = f"https://api.github.com/repos/{repo_path}/commits?per_page=10"
-            commits_response = self.session.get(commits_url)
-            commits = commits_response.json() if commits_response.status_code == 200 else []
+            # Languages and recent commits (limited info without auth)
+            languages = (lang_future.result()[1] if lang_future else None) or {}
+            commits = (commits_future.result()[1] if commits_future else None) or []
             
             return {
                 'name': repo_data.get('name', ''),
@@ -91,8 +379,64 @@ class GitHubClient:
         except Exception as e:
             raise Exception(f"Failed to fetch public repository info: {str(e)}")
     
-    def _get_authenticated_repo_info(self, repo_path: str) -> Dict[str, Any]:
-        """Get repository info using authenticated GitHub client"""
+    def _get_repo_info_graphql(self, repo_path: str) -> Dict[str, Any]:
+        """Get repository info with a single GraphQL query (requires a token)"""
+        owner, _, name = repo_path.strip().partition('/')
+        if not owner or not name:
+            raise Exception(f"Invalid repository path format: {repo_path}")
+        
+        # Contributors only exist in REST; fetch them alongside the query
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            contributors_future = executor.submit(
+                self._fetch_or_default, 'contributors', lambda: self._rest_contributors(repo_path), (0, [])
+            )
+            response = self.session.post(
+                GRAPHQL_URL,
+                json={'query': _REPO_INFO_QUERY, 'variables': {'owner': owner, 'name': name}},
+            )
+            contributors_count, contributors = contributors_future.result()
+        if response.status_code != 200:
+            raise Exception(f"GitHub GraphQL error: {response.status_code}")
+        
+        payload = _json(response)
+        repo = (payload.get('data') or {}).get('repository')
+        if payload.get('errors') or not repo:
+            errors = payload.get('errors') or [{}]
+            raise Exception(errors[0].get('message', 'Repository not found'))
+        
+        branch = repo.get('defaultBranchRef') or {}
+        history = (branch.get('target') or {}).get('history') or {}
+        # REST's open_issues_count includes pull requests
+        open_issues = repo['issues']['totalCount'] + repo['pullRequests']['totalCount']
+        license_info = repo.get('licenseInfo')
+        
+        return {
+            'name': repo.get('name', ''),
+            'full_name': repo.get('nameWithOwner', ''),
+            'description': repo.get('description', ''),
+            'url': repo.get('url', ''),
+            'clone_url': f"{repo.get('url', '')}.git",
+            'languages': {edge['node']['name']: edge['size'] for edge in repo['languages']['edges']},
+            'contributors_count': contributors_count,
+            'contributors': contributors,
+            'recent_commits': len(history.get('nodes') or []),
+            'open_issues': open_issues,
+            'stats': {
+                'stars': repo.get('stargazerCount', 0),
+                'forks': repo.get('forkCount', 0),
+                'open_issues': open_issues,
+                'size': repo.get('diskUsage', 0),
+                'created_at': _parse_timestamp(repo.get('createdAt')),
+                'updated_at': _parse_timestamp(repo.get('updatedAt')),
+                'default_branch': branch.get('name', 'main'),
+                'has_issues': repo.get('hasIssuesEnabled', False),
+                'has_projects': repo.get('hasProjectsEnabled', False),
+                'has_wiki': repo.get('hasWikiEnabled', False)
+            },
+            'topics': [node['topic']['name'] for node in repo['repositoryTopics']['nodes']],
+            'license': license_info.get('name') if license_info else None
+        }
+    
     def _get_authenticated_repo_info(self, repo_path: str) -> Dict[str, Any]:
         """Get repository info using authenticated GitHub client"""
         try:
@@ -111,35 +455,25 @@ class GitHubClient:
             
             print(f"Fetching repository info for: {owner}/{repo_name}")
             
-            repo = self.github.get_repo(repo_path)
-            
-            # Get languages with error handling
-            try:
-                languages = repo.get_languages()
-            except Exception as e:
-                print(f"Warning: Could not fetch languages: {e}")
-                languages = {}
-            
-            # Get contributors with error handling
-            try:
-                contributors = list(repo.get_contributors())
-            except Exception as e:
-                print(f"Warning: Could not fetch contributors: {e}")
-                contributors = []
+            repo = self._repo(repo_path)
             
-            # Get recent commits with error handling
-            try:
-                commits = list(repo.get_commits()[:10])
-            except Exception as e:
-                print(f"Warning: Could not fetch commits: {e}")
-                commits = []
+            # The detail requests are independent blocking calls, so run them on a
+            # small pool; each falls back to an empty value on error
+            with ThreadPoolExecutor(max_workers=self.MAX_PARALLEL_REQUESTS) as executor:
+                languages_future = executor.submit(self._fetch_or_default, 'languages', repo.get_languages, {})
+                contributors_future = executor.submit(
+                    self._fetch_or_default, 'contributors', lambda: self._top_contributors(repo), (0, [])
+                )
+                # totalCount asks for a single-item page and reads the total from its Link header
+                commits_future = executor.submit(
+                    self._fetch_or_default, 'commits', lambda: min(repo.get_commits().totalCount, 10), 0
+                )
+                topics_future = executor.submit(self._fetch_or_default, 'topics', repo.get_topics, [])
             
-            # Get open issues with error handling
-            try:
-                open_issues = list(repo.get_issues(state='open')[:20])
-            except Exception as e:
-                print(f"Warning: Could not fetch issues: {e}")
-                open_issues = []
+            languages = languages_future.result()
+            contributors_count, contributors = contributors_future.result()
+            recent_commits = commits_future.result()
+            topics = topics_future.result()
             
             # Get repository stats
             stats = {
@@ -155,13 +489,6 @@ class GitHubClient:
                 'has_wiki': getattr(repo, 'has_wiki', False)
             }
             
-            # Get topics with error handling
-            try:
-                topics = repo.get_topics()
-            except Exception as e:
-                print(f"Warning: Could not fetch topics: {e}")
-                topics = []
-            
             # Get license with error handling
             try:
                 license_name = repo.license.name if repo.license else None
@@ -176,21 +503,48 @@ class GitHubClient:
                 'url': getattr(repo, 'html_url', ''),
                 'clone_url': getattr(repo, 'clone_url', ''),
                 'languages': languages,
-                'contributors_count': len(contributors),
-                'contributors': [getattr(c, 'login', 'unknown') for c in contributors[:5]],
-                'recent_commits': len(commits),
-                'open_issues': len(open_issues),
+                'contributors_count': contributors_count,
+                'contributors': [getattr(c, 'login', 'unknown') for c in contributors],
+                'recent_commits': recent_commits,
+                'open_issues': stats['open_issues'],
                 'stats': stats,
                 'topics': topics,
                 'license': license_name
             }
             
         except Exception as e:
-            import traceback
             error_details = traceback.format_exc()
             print(f"Error in _get_authenticated_repo_info: {error_details}")
             raise Exception(f"Failed to fetch authenticated repository info: {str(e)}")
     
+    def _rest_contributors(self, repo_path: str, limit: int = 5) -> Tuple[int, List[str]]:
+        """Return (total contributors, first `limit` contributor logins) from the REST API"""
+        url = f"https://api.github.com/repos/{repo_path}/contributors"
+        # With one contributor per page, the last page number is the total
+        count_response = self.session.get(url, params={'per_page': 1})
+        count_response.raise_for_status()
+        last_page = count_response.links.get('last', {}).get('url')
+        total = int(httpx.URL(last_page).params['page']) if last_page else len(_json(count_response) or [])
+        
+        response = self.session.get(url, params={'per_page': limit})
+        response.raise_for_status()
+        return total, [user.get('login', 'unknown') for user in (_json(response) or [])]
+    
+    @staticmethod
+    def _top_contributors(repo, limit: int = 5) -> Tuple[int, list]:
+        """Return (total contributors, first `limit` contributors) without paging through all of them"""
+        contributors = repo.get_contributors()
+        return contributors.totalCount, list(islice(contributors, limit))
+    
+    @staticmethod
+    def _fetch_or_default(label: str, fetch, default: Any) -> Any:
+        """Call fetch(), printing a warning and returning default if it fails"""
+        try:
+            return fetch()
+        except Exception as e:
+            print(f"Warning: Could not fetch {label}: {e}")
+            return default
+    
     def clone_repository(self, repo_path: str) -> Dict[str, str]:
         """Clone repository to temporary directory"""
         try:
@@ -204,7 +558,7 @@ class GitHubClient:
                     clone_url = f"https://{self.token}@github.com/{repo_path}.git"
                 else:
                     # Fallback to regular clone URL (might fail for private repos)
-                    repo = self.github.get_repo(repo_path)
+                    repo = self._repo(repo_path)
                     clone_url = repo.clone_url
             
             # Create temporary directory
@@ -214,7 +568,7 @@ class GitHubClient:
             print(f"Cloning {repo_path} to {temp_dir}")
             
             # Use GitPython's clone_from with authenticated URL
-            cloned_repo = Repo.clone_from(clone_url, temp_dir)
+            cloned_repo = Repo.clone_from(clone_url, temp_dir, multi_options=self.CLONE_OPTIONS)
             
             return {
                 'local_path': temp_dir,
@@ -231,11 +585,12 @@ class GitHubClient:
     def get_file_content(self, repo_path: str, file_path: str, ref: str = None) -> Optional[str]:
         """Get content of a specific file from repository"""
         try:
-            repo = self.github.get_repo(repo_path)
+            repo = self._repo(repo_path)
             file_content = repo.get_contents(file_path, ref=ref)
             
+            if file_content.size > self.STREAM_FILE_THRESHOLD and file_content.download_url:
+                return self._download_text(file_content.download_url)
             if file_content.encoding == 'base64':
-                import base64
                 return base64.b64decode(file_content.content).decode('utf-8')
             else:
                 return file_content.content
@@ -244,33 +599,65 @@ class GitHubClient:
             print(f"Could not fetch file {file_path}: {str(e)}")
             return None
     
+    def _download_text(self, url: str) -> str:
+        """Stream a raw file and decode it as UTF-8 chunk by chunk"""
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        with self.session.stream('GET', url) as response:
+            response.raise_for_status()
+            parts = [decoder.decode(chunk) for chunk in response.iter_bytes(chunk_size=65536)]
+        parts.append(decoder.decode(b'', final=True))
+        return ''.join(parts)
+    
     def search_files(self, repo_path: str, query: str) -> list:
         """Search for files in repository"""
         try:
-            repo = self.github.get_repo(repo_path)
-            contents = repo.get_contents("")
+            query_lower = query.lower()
             
-            def search_recursive(contents, query_lower):
-                files = []
-                for content in contents:
-                    if content.type == "dir":
-                        files.extend(search_recursive(repo.get_contents(content.path), query_lower))
-                    else:
-                        if query_lower in content.name.lower():
-                            files.append(content.path)
-                return files
+            # One recursive git tree request lists every file on the default branch
+            status, tree = self._get_json(f"https://api.github.com/repos/{repo_path}/git/trees/HEAD?recursive=1")
+            if status == 200 and not tree.get('truncated'):
+                return [
+                    entry['path'] for entry in tree.get('tree', [])
+                    if entry.get('type') == 'blob' and query_lower in entry['path'].rsplit('/', 1)[-1].lower()
+                ]
             
-            return search_recursive(contents, query.lower())
+            # Very large trees come back truncated; walk the directories instead
+            return self._search_files_recursive(repo_path, query_lower)
             
         except Exception as e:
             print(f"Search failed: {str(e)}")
             return []
     
+    def _search_files_recursive(self, repo_path: str, query_lower: str) -> list:
+        """Search for files by listing directories level by level through the contents API"""
+        repo = self._repo(repo_path)
+        files = []
+        level = [""]
+        
+        # Sibling directories are independent, so list each level concurrently
+        with ThreadPoolExecutor(max_workers=self.MAX_DIRECTORY_REQUESTS) as executor:
+            while level:
+                subdirectories = []
+                for contents in executor.map(repo.get_contents, level):
+                    for content in contents:
+                        if content.type == "dir":
+                            subdirectories.append(content.path)
+                        elif query_lower in content.name.lower():
+                            files.append(content.path)
+                level = subdirectories
+        
+        return files
+    
     def cleanup_temp_directory(self, temp_dir: str):
-        """Clean up temporary directory"""
+        """Clean up temporary directory in the background"""
         try:
             if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir)
+                # Renaming frees the path immediately; deleting a large clone can take a while
+                trash_dir = f"{temp_dir}.trash"
+                os.rename(temp_dir, trash_dir)
+                threading.Thread(
+                    target=shutil.rmtree, args=(trash_dir,), kwargs={'ignore_errors': True}, daemon=True
+                ).start()
                 print(f"Cleaned up temporary directory: {temp_dir}")
         except Exception as e:
             print(f"Failed to cleanup {temp_dir}: {str(e)}")
\ No newline at end of file
@@ -1,11 +1,341 @@
 import os
 import re
-import json
-from pathlib import Path
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+import ast
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Any, Optional, Tuple
+from datetime import date
 from config import Config
 
+logger = logging.getLogger(__name__)
+
+try:
+    import pathspec
+    PATHSPEC_AVAILABLE = True
+except ImportError:
+    PATHSPEC_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# File types each per-file check applies to
+_SECURITY_EXTENSIONS = frozenset({'.py', '.js', '.ts', '.java', '.cs', '.php'})
+_QUALITY_EXTENSIONS = frozenset({'.py', '.js', '.ts', '.java', '.cs'})
+_PERFORMANCE_EXTENSIONS = frozenset({'.py', '.js', '.ts'})
+_JS_EXTENSIONS = frozenset({'.js', '.ts', '.jsx', '.tsx'})
+_SOURCE_EXTENSIONS = _SECURITY_EXTENSIONS
+# Per-file checks as (result category, IssueDetector method, file types it applies to)
+_FILE_CHECKS = (
+    ('security_issues', '_scan_security', _SECURITY_EXTENSIONS),
+    ('code_quality_issues', '_scan_code_quality', _QUALITY_EXTENSIONS),
+    ('documentation_issues', '_scan_docstrings', frozenset({'.py'})),
+    ('performance_issues', '_scan_performance', _PERFORMANCE_EXTENSIONS)
+)
+# The (result category, method) pairs to run for each source file type, resolved once
+_EXTENSION_CHECKS = {
+    extension: tuple((category, method) for category, method, extensions in _FILE_CHECKS if extension in extensions)
+    for extension in _SOURCE_EXTENSIONS
+}
+# Every file type detect_issues looks at (the dependency check also wants JSX/TSX)
+_COLLECTED_EXTENSIONS = _SOURCE_EXTENSIONS | _JS_EXTENSIONS
+# Dependency, virtualenv and build output directories that hold no project code
+_VENDORED_DIRECTORIES = frozenset({'node_modules', 'venv', '.venv', 'dist', 'build', '__pycache__', '.tox', 'target'})
+
+# Fixed helper patterns used inside the per-line scans
+_COMMENT_WITH_NUMBER = re.compile(r'#.*\d+')
+_JS_FUNCTION_NAME = re.compile(r'function\s+(\w+)')
+# The TODO rule is a plain keyword alternation, so str.find can locate it without re
+_TODO_KEYWORDS = ('TODO', 'FIXME', 'HACK', 'XXX')
+# Every magic number holds a run of three digits, which is far cheaper to find than the word-bounded rule
+_DIGIT_RUN = re.compile(r'\d\d\d')
+# AST fields holding nested statements (except handlers and match cases carry their own body)
+_STATEMENT_BLOCK_FIELDS = ('body', 'orelse', 'finalbody', 'handlers', 'cases')
+# Code quality issue types counted as complex code for action items
+_COMPLEX_CODE_TYPES = frozenset({'long_function', 'deep_nesting'})
+
+
+def _combine_patterns(patterns: List[re.Pattern]) -> re.Pattern:
+    """Merge patterns into one zero-width alternation that matches wherever any of them would
+    
+    Each pattern keeps its own case sensitivity, and the lookahead consumes nothing, so a match
+    that spills onto the next line cannot hide a later one.
+    """
+    parts = [f'(?i:{p.pattern})' if p.flags & re.IGNORECASE else f'(?:{p.pattern})' for p in patterns]
+    return re.compile('(?=' + '|'.join(parts) + ')')
+
+
+def _lines_at(text, positions, newline='\n') -> List[Tuple[int, Any]]:
+    """Return (1-based line number, line text) for each line holding one of the ascending positions
+    
+    Lines are sliced out of text (str or bytes) around each position, so it is never split into a list.
+    """
+    matched = []
+    line_no = 1
+    last = 0
+    line_end = -1
+    for pos in positions:
+        if pos <= line_end:
+            continue  # Already reported this line
+        line_no += text.count(newline, last, pos)
+        last = pos
+        line_start = text.rfind(newline, 0, pos) + 1
+        line_end = text.find(newline, pos)
+        if line_end == -1:
+            line_end = len(text)
+        matched.append((line_no, text[line_start:line_end]))
+    return matched
+
+
+def _matching_lines(pattern: re.Pattern, content: str) -> List[Tuple[int, str]]:
+    """Return (1-based line number, line text) for each line on which pattern matches, in order"""
+    return _lines_at(content, (match.start() for match in pattern.finditer(content)))
+
+
+# Compiled hyperscan databases, shared by every detector in the process (and inherited by forked workers)
+_hyperscan_databases = {}
+
+
+def _keyword_positions(content: str, keywords: Tuple[str, ...]) -> List[int]:
+    """Return the ascending start positions of every occurrence of the keywords in content"""
+    positions = []
+    for keyword in keywords:
+        pos = content.find(keyword)
+        while pos != -1:
+            positions.append(pos)
+            pos = content.find(keyword, pos + 1)
+    positions.sort()
+    return positions
+
+
+def _compile_hyperscan(groups: Dict[str, List[re.Pattern]]) -> Optional[Tuple[Any, List[str]]]:
+    """Compile every group's patterns into one hyperscan database; returns (database, group of each pattern id)
+    
+    Patterns get Unicode semantics to agree with re on str. Any that hyperscan cannot compile exactly
+    (a word boundary in UCP mode, for one) use its prefilter mode, which matches a superset; that is
+    enough since callers recheck each candidate line with re. Compiling takes a noticeable fraction
+    of a second, so each distinct set of patterns is compiled once per process.
+    """
+    key = tuple((group, pattern.pattern, pattern.flags) for group, patterns in groups.items() for pattern in patterns)
+    if key in _hyperscan_databases:
+        return _hyperscan_databases[key]
+    
+    expressions, flags, group_of_id = [], [], []
+    for group, patterns in groups.items():
+        for pattern in patterns:
+            expression = pattern.pattern.encode('utf-8')
+            pattern_flags = hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+            if pattern.flags & re.IGNORECASE:
+                pattern_flags |= hyperscan.HS_FLAG_CASELESS
+            try:
+                hyperscan.Database().compile(expressions=[expression], ids=[0], flags=[pattern_flags])
+            except hyperscan.error:
+                pattern_flags |= hyperscan.HS_FLAG_PREFILTER
+            expressions.append(expression)
+            flags.append(pattern_flags)
+            group_of_id.append(group)
+    
+    try:
+        database = hyperscan.Database()
+        database.compile(expressions=expressions, ids=list(range(len(expressions))), flags=flags)
+        compiled = (database, group_of_id)
+    except hyperscan.error:
+        compiled = None
+    _hyperscan_databases[key] = compiled
+    return compiled
+
+
+def _hyperscan_matching_lines(compiled: Tuple[Any, List[str], Any], content: str) -> Dict[str, List[Tuple[int, str]]]:
+    """Run one hyperscan pass over content; returns the candidate lines of every group
+    
+    compiled is (database, group of each pattern id, scratch space for this caller).
+    """
+    database, group_of_id, scratch = compiled
+    data = content.encode('utf-8')
+    match_ends = {group: [] for group in group_of_id}
+    
+    def on_match(pattern_id, start, end, flags, context):
+        # Without start-of-match tracking only the end is known; a match confined to one line ends on it
+        match_ends[group_of_id[pattern_id]].append(end - 1)
+    
+    database.scan(data, match_event_handler=on_match, scratch=scratch)
+    return {
+        group: [(line_no, line.decode('utf-8')) for line_no, line in _lines_at(data, sorted(ends), b'\n')]
+        for group, ends in match_ends.items()
+    }
+
+
+def _load_gitignore(repo_path: str):
+    """Return a matcher for the repository's top-level .gitignore, or None if there is none to apply"""
+    if not PATHSPEC_AVAILABLE:
+        return None
+    try:
+        with open(os.path.join(repo_path, '.gitignore'), 'r', encoding='utf-8', errors='ignore') as f:
+            return pathspec.GitIgnoreSpec.from_lines(f.read().splitlines())
+    except (OSError, ValueError):
+        return None
+
+
+def _scandir_walk(root: str, extensions: frozenset, ignore=None, relative_root: str = ''):
+    """Yield (file_path, relative_path) for files under root whose extension is in extensions
+    
+    Same top-down order as os.walk, but the DirEntry type cache saves a stat call per entry.
+    Hidden, vendored and gitignored directories are skipped and symlinked directories are not
+    followed; gitignored, minified and oversized files are left out.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subdirs = []
+    for entry in entries:
+        relative_path = os.path.join(relative_root, entry.name)
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if (entry.name.startswith('.') or entry.name in _VENDORED_DIRECTORIES
+                        or (ignore and ignore.match_file(relative_path.replace(os.sep, '/') + '/'))):
+                    continue
+                subdirs.append((entry, relative_path))
+            elif (os.path.splitext(entry.name)[1] in extensions and entry.is_file()
+                    and not entry.name.endswith('.min.js')
+                    and entry.stat().st_size <= Config.ISSUE_SCAN_MAX_FILE_BYTES
+                    and not (ignore and ignore.match_file(relative_path.replace(os.sep, '/')))):
+                yield entry.path, relative_path
+        except OSError:
+            continue
+    for entry, relative_path in subdirs:
+        yield from _scandir_walk(entry.path, extensions, ignore, relative_path)
+
+
+# Action item rules as (applies, template, fields) triples over a per-report context dict, in
+# priority order. Templates hold the invariant keys; fields(ctx) supplies the per-report ones.
+_ACTION_ITEM_RULES = (
+    # Security issues - highest priority
+    (lambda ctx: ctx['critical_security'], {
+        'priority': 1,
+        'category': 'Security',
+        'title': 'Address Critical Security Issues',
+        'action': 'Immediately review and fix hardcoded secrets, SQL injection, and XSS vulnerabilities',
+        'impact': 'High - Security vulnerabilities can lead to data breaches'
+    }, lambda ctx: {'description': f'Found {ctx["critical_security"]} critical security issues'}),
+    # Test coverage - high priority
+    (lambda ctx: ctx['test_issues'], {
+        'priority': 2,
+        'category': 'Testing',
+        'title': 'Improve Test Coverage',
+        'description': 'Low test coverage detected',
+        'action': 'Add unit tests for core functionality and critical business logic',
+        'impact': 'Medium - Poor test coverage increases bug risk'
+    }, lambda ctx: {}),
+    # Documentation - medium priority
+    (lambda ctx: ctx['doc_issues'], {
+        'priority': 3,
+        'category': 'Documentation',
+        'title': 'Improve Documentation',
+        'action': 'Add README, license, and code documentation',
+        'impact': 'Medium - Poor documentation reduces maintainability'
+    }, lambda ctx: {'description': f'Found {ctx["doc_issues"]} documentation issues'}),
+    # Code quality - medium priority
+    (lambda ctx: ctx['complex_code'], {
+        'priority': 4,
+        'category': 'Code Quality',
+        'title': 'Refactor Complex Code',
+        'action': 'Break down long functions and reduce nesting complexity',
+        'impact': 'Medium - Complex code is harder to maintain and debug'
+    }, lambda ctx: {'description': f'Found {ctx["complex_code"]} complex code issues'}),
+    # Dependencies - lower priority
+    (lambda ctx: ctx['dependency_issues'], {
+        'priority': 5,
+        'category': 'Dependencies',
+        'title': 'Improve Dependency Management',
+        'action': 'Add proper dependency management files and lock files',
+        'impact': 'Low - Improves build reproducibility'
+    }, lambda ctx: {'description': f'Found {ctx["dependency_issues"]} dependency issues'})
+)
+
+
+class IssueCollector:
+    """Gathers issue records by category, counting severities as they are added"""
+    
+    CATEGORIES = ('security_issues', 'code_quality_issues', 'documentation_issues', 'performance_issues',
+                  'dependency_issues', 'structure_issues', 'maintenance_issues')
+    
+    def __init__(self):
+        self.issues = {category: [] for category in self.CATEGORIES}
+        self.severity_counts = {'critical': 0, 'high': 0, 'medium': 0, 'low': 0}
+        # Per-file checks that raised, as {'file', 'check', 'error'} records
+        self.scan_errors = []
+    
+    def add(self, category: str, record: Dict[str, Any]) -> None:
+        """Add one issue record to category"""
+        self.extend(category, (record,))
+    
+    def extend(self, category: str, records: List[Dict[str, Any]]) -> None:
+        """Add a batch of issue records to category"""
+        self.issues[category].extend(records)
+        counts = self.severity_counts
+        for record in records:
+            severity = record.get('severity')
+            if severity in counts:
+                counts[severity] += 1
+
+
+# Detector used by each scanning pool worker, built once per process by _init_scan_worker
+_worker_detector = None
+
+
+def _init_scan_worker() -> None:
+    """Pool initializer: compile the detection patterns in this worker process"""
+    global _worker_detector
+    _worker_detector = IssueDetector.__new__(IssueDetector)
+    _worker_detector._compile_patterns()
+
+
+def _scan_file(file_path: str, relative_path: str) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """Pool task: scan one source file with the worker's detector"""
+    return _worker_detector._scan_source_file(file_path, relative_path)
+
+
+# Scanning pool shared by every detector in this process, started on first use
+_scan_pool = None
+_scan_pool_lock = threading.Lock()
+
+
+def _get_scan_pool() -> ProcessPoolExecutor:
+    """Return the shared scanning pool, starting it on first use
+    
+    Workers come from a forkserver (or spawn) instead of forking this process, which may be
+    running other threads (log listener, HTTP pools) whose held locks a fork would copy.
+    """
+    global _scan_pool
+    with _scan_pool_lock:
+        if _scan_pool is None:
+            if 'forkserver' in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context('forkserver')
+                # Workers fork from a server that has already imported this module
+                context.set_forkserver_preload([__name__])
+            else:
+                context = multiprocessing.get_context('spawn')
+            _scan_pool = ProcessPoolExecutor(max_workers=Config.ISSUE_SCAN_WORKERS,
+                                             initializer=_init_scan_worker, mp_context=context)
+        return _scan_pool
+
+
+def _discard_scan_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a failed scanning pool so the next scan starts a fresh one"""
+    global _scan_pool
+    with _scan_pool_lock:
+        if _scan_pool is pool:
+            _scan_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
 class IssueDetector:
     """Detects various issues in code repositories and suggests corrections"""
     
@@ -20,30 +350,34 @@ class IssueDetector:
                 # Veracode analyzer not available
                 self.veracode_analyzer = None
         
+        self._compile_patterns()
+    
+    def _compile_patterns(self):
+        """Build the detection rules (also run in each scanning worker process)"""
         self.issue_patterns = {
             'security': {
                 'hardcoded_secrets': [
-                    r'password\s*=\s*["\'][^"\']+["\']',
-                    r'api_key\s*=\s*["\'][^"\']+["\']',
-                    r'secret\s*=\s*["\'][^"\']+["\']',
-                    r'token\s*=\s*["\'][^"\']+["\']'
+                    re.compile(r'password\s*=\s*["\'][^"\']+["\']', re.IGNORECASE),
+                    re.compile(r'api_key\s*=\s*["\'][^"\']+["\']', re.IGNORECASE),
+                    re.compile(r'secret\s*=\s*["\'][^"\']+["\']', re.IGNORECASE),
+                    re.compile(r'token\s*=\s*["\'][^"\']+["\']', re.IGNORECASE)
                 ],
                 'sql_injection': [
-                    r'execute\s*\(\s*["\'].*\+.*["\']',
-                    r'query\s*\(\s*["\'].*\+.*["\']'
+                    re.compile(r'execute\s*\(\s*["\'].*\+.*["\']', re.IGNORECASE),
+                    re.compile(r'query\s*\(\s*["\'].*\+.*["\']', re.IGNORECASE)
                 ],
                 'xss_vulnerabilities': [
-                    r'innerHTML\s*=\s*.*\+',
-                    r'document\.write\s*\(',
-                    r'eval\s*\('
+                    re.compile(r'innerHTML\s*=\s*.*\+'),
+                    re.compile(r'document\.write\s*\('),
+                    re.compile(r'eval\s*\(')
                 ]
             },
             'code_quality': {
                 'long_functions': 50,  # lines
                 'deep_nesting': 5,     # levels
-                'magic_numbers': r'\b\d{3,}\b',
-                'todo_comments': r'(TODO|FIXME|HACK|XXX)',
-                'dead_code': r'#.*dead|#.*unused|#.*remove'
+                'magic_numbers': re.compile(r'\b\d{3,}\b'),
+                'todo_comments': re.compile(r'(TODO|FIXME|HACK|XXX)'),
+                'dead_code': re.compile(r'#.*dead|#.*unused|#.*remove')
             },
             'documentation': {
                 'missing_docstrings': True,
@@ -53,36 +387,62 @@ class IssueDetector:
             },
             'performance': {
                 'inefficient_loops': [
-                    r'for.*in.*range\(len\(',
-                    r'while.*len\('
+                    re.compile(r'for.*in.*range\(len\('),
+                    re.compile(r'while.*len\(')
                 ],
                 'memory_leaks': [
-                    r'global\s+\w+\s*=\s*\[\]',
-                    r'cache\s*=\s*\{\}'
+                    re.compile(r'global\s+\w+\s*=\s*\[\]'),
+                    re.compile(r'cache\s*=\s*\{\}')
                 ]
             }
         }
+        
+        # One scan over a file's content finds the few lines worth checking pattern by pattern
+        security = self.issue_patterns['security']
+        performance = self.issue_patterns['performance']
+        quality = self.issue_patterns['code_quality']
+        prefilter_groups = {
+            'security': security['hardcoded_secrets'] + security['sql_injection'] + security['xss_vulnerabilities'],
+            'performance': performance['inefficient_loops'] + performance['memory_leaks'],
+            'todo_comments': [quality['todo_comments']],
+            'magic_numbers': [_DIGIT_RUN]
+        }
+        self._prefilters = {
+            check: patterns[0] if len(patterns) == 1 else _combine_patterns(patterns)
+            for check, patterns in prefilter_groups.items()
+        }
+        self._prefilters['todo_comments'] = _TODO_KEYWORDS
+        # With hyperscan installed, a single automaton pass finds those lines for every check at once;
+        # the database is shared, but scans need scratch space of their own
+        self._hyperscan = None
+        compiled = _compile_hyperscan(prefilter_groups) if HYPERSCAN_AVAILABLE else None
+        if compiled:
+            database, group_of_id = compiled
+            self._hyperscan = (database, group_of_id, hyperscan.Scratch(database))
     
     def detect_issues(self, repo_path: str, repo_info: Dict[str, Any]) -> Dict[str, Any]:
         """Detect various issues in the repository"""
         try:
-            issues = {
-                'security_issues': self._detect_security_issues(repo_path),
-                'code_quality_issues': self._detect_code_quality_issues(repo_path),
-                'documentation_issues': self._detect_documentation_issues(repo_path, repo_info),
-                'performance_issues': self._detect_performance_issues(repo_path),
-                'dependency_issues': self._detect_dependency_issues(repo_path),
-                'structure_issues': self._detect_structure_issues(repo_path),
-                'maintenance_issues': self._detect_maintenance_issues(repo_info)
-            }
+            root_entries = self._list_root(repo_path)
+            source_files = self._collect_files(repo_path)
+            
+            collector = IssueCollector()
+            collector.extend('documentation_issues', self._detect_documentation_issues(root_entries, repo_info))
+            self._scan_source_files(source_files, collector)
+            collector.extend('dependency_issues', self._detect_dependency_issues(root_entries, source_files))
+            collector.extend('structure_issues', self._detect_structure_issues(root_entries))
+            collector.extend('maintenance_issues', self._detect_maintenance_issues(repo_info))
+            issues = collector.issues
             
             # Add Veracode security issues if available
             # Note: Veracode analysis is async and handled in enhanced report generator
             # Here we just mark that Veracode results should be included if available
             issues['veracode_integration_enabled'] = self.veracode_analyzer is not None
             
-            # Calculate severity scores
-            issues['severity_summary'] = self._calculate_severity_summary(issues)
+            # Severity scores were counted as issues were collected
+            issues['severity_summary'] = collector.severity_counts
+            if collector.scan_errors:
+                issues['scan_errors'] = collector.scan_errors
             
             # Generate prioritized action items
             issues['action_items'] = self._generate_action_items(issues)
@@ -101,133 +461,256 @@ class IssueDetector:
                 'maintenance_issues': []
             }
     
-    def _detect_security_issues(self, repo_path: str) -> List[Dict[str, Any]]:
-        """Detect security-related issues"""
+    def _list_root(self, repo_path: str) -> Dict[str, bool]:
+        """Read the repository's top-level directory once; maps each entry name to whether it is a directory"""
+        with os.scandir(repo_path) as it:
+            return {entry.name: entry.is_dir() for entry in it}
+    
+    def _collect_files(self, repo_path: str) -> List[Tuple[str, str]]:
+        """Walk the repository once, skipping hidden, vendored and ignored paths; returns (file_path, relative_path) pairs"""
+        return list(_scandir_walk(repo_path, _COLLECTED_EXTENSIONS, _load_gitignore(repo_path)))
+    
+    def _scan_source_files(self, source_files: List[Tuple[str, str]], collector: IssueCollector) -> None:
+        """Read each source file once and run every per-file check that applies to its type"""
+        source_files = [(path, rel) for path, rel in source_files
+                        if os.path.splitext(path)[1] in _EXTENSION_CHECKS]
+        for file_results in self._map_source_files(source_files):
+            if file_results:
+                # Failures are logged here rather than in pool workers, which do not share the app's log handlers
+                for error in file_results.pop('scan_errors', ()):
+                    logger.warning("⚠️ Issue check %s failed on %s: %s", error['check'], error['file'], error['error'])
+                    collector.scan_errors.append(error)
+                for category, found in file_results.items():
+                    collector.extend(category, found)
+    
+    def _map_source_files(self, source_files: List[Tuple[str, str]]):
+        """Scan files in order, on a process pool when there are enough of them to pay for it"""
+        workers = Config.ISSUE_SCAN_WORKERS
+        if workers > 1 and len(source_files) >= Config.ISSUE_SCAN_PARALLEL_MIN_FILES:
+            paths, relative_paths = zip(*source_files)
+            pool = None
+            try:
+                pool = _get_scan_pool()
+                return list(pool.map(_scan_file, paths, relative_paths,
+                                     chunksize=max(1, len(source_files) // (workers * 4))))
+            except (OSError, BrokenProcessPool):
+                # Process pools can be unavailable (e.g. restricted sandboxes) or lose a worker; scan serially instead
+                if pool is not None:
+                    _discard_scan_pool(pool)
+        return [self._scan_source_file(path, rel) for path, rel in source_files]
+    
+    def _scan_source_file(self, file_path: str, relative_path: str) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """Run the per-file checks for one source file; returns None if it cannot be read"""
+        try:
+            # Sniff the head first so binary files with a source extension are never read whole
+            with open(file_path, 'rb') as f:
+                if b'\x00' in f.read(1024):
+                    return None
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+        except OSError:
+            return None
+        extension = os.path.splitext(file_path)[1]
+        # Function spans and docstrings for both Python checks come from one parse
+        python_defs = self._analyze_python(content) if extension == '.py' else None
+        
+        try:
+            candidates = _hyperscan_matching_lines(self._hyperscan, content) if self._hyperscan else {}
+        except Exception:
+            candidates = {}  # Each check falls back to its own regex prefilter
+        
+        # Checks fail independently, so one failing check does not drop the file's other categories;
+        # a failure is recorded under 'scan_errors' so the category is not mistaken for clean
+        results = {}
+        for category, method in _EXTENSION_CHECKS.get(extension, ()):
+            try:
+                results[category] = getattr(self, method)(content, relative_path, python_defs, candidates)
+            except Exception as e:
+                results.setdefault('scan_errors', []).append({
+                    'file': relative_path,
+                    'check': method,
+                    'error': f'{type(e).__name__}: {e}'
+                })
+        return results
+    
+    def _candidate_lines(self, check: str, content: str,
+                         candidates: Optional[Dict[str, List[Tuple[int, str]]]]) -> List[Tuple[int, str]]:
+        """Lines of content that may match check's patterns, taken from the hyperscan pass when one ran"""
+        if candidates and check in candidates:
+            return candidates[check]
+        prefilter = self._prefilters[check]
+        if isinstance(prefilter, tuple):
+            return _lines_at(content, _keyword_positions(content, prefilter))
+        return _matching_lines(prefilter, content)
+    
+    def _scan_security(self, content: str, relative_path: str,
+                       python_defs: Optional[List[Tuple[str, str, int, int, bool]]] = None,
+                       candidates: Optional[Dict[str, List[Tuple[int, str]]]] = None) -> List[Dict[str, Any]]:
+        """Detect security-related issues in one file"""
         security_issues = []
+        candidate_lines = self._candidate_lines('security', content, candidates)
         
-        for root, dirs, files in os.walk(repo_path):
-            # Skip hidden directories
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
-            
-            for file in files:
-                if file.endswith(('.py', '.js', '.ts', '.java', '.cs', '.php')):
-                    file_path = os.path.join(root, file)
-                    relative_path = os.path.relpath(file_path, repo_path)
-                    
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read()
-                            lines = content.split('\n')
-                            
-                            # Check for hardcoded secrets
-                            for i, line in enumerate(lines, 1):
-                                for pattern in self.issue_patterns['security']['hardcoded_secrets']:
-                                    if re.search(pattern, line, re.IGNORECASE):
-                                        security_issues.append({
-                                            'type': 'hardcoded_secret',
-                                            'severity': 'critical',
-                                            'file': relative_path,
-                                            'line': i,
-                                            'description': 'Potential hardcoded secret detected',
-                                            'suggestion': 'Move secrets to environment variables or secure configuration'
-                                        })
-                            
-                            # Check for SQL injection vulnerabilities
-                            for i, line in enumerate(lines, 1):
-                                for pattern in self.issue_patterns['security']['sql_injection']:
-                                    if re.search(pattern, line, re.IGNORECASE):
-                                        security_issues.append({
-                                            'type': 'sql_injection',
-                                            'severity': 'critical',
-                                            'file': relative_path,
-                                            'line': i,
-                                            'description': 'Potential SQL injection vulnerability',
-                                            'suggestion': 'Use parameterized queries or ORM methods'
-                                        })
-                            
-                            # Check for XSS vulnerabilities
-                            for i, line in enumerate(lines, 1):
-                                for pattern in self.issue_patterns['security']['xss_vulnerabilities']:
-                                    if re.search(pattern, line):
-                                        security_issues.append({
-                                            'type': 'xss_vulnerability',
-                                            'severity': 'high',
-                                            'file': relative_path,
-                                            'line': i,
-                                            'description': 'Potential XSS vulnerability',
-                                            'suggestion': 'Sanitize user input and use safe DOM manipulation methods'
-                                        })
-                    except:
-                        continue
+        # Check for hardcoded secrets
+        for i, line in candidate_lines:
+            for pattern in self.issue_patterns['security']['hardcoded_secrets']:
+                if pattern.search(line):
+                    security_issues.append({
+                        'type': 'hardcoded_secret',
+                        'severity': 'critical',
+                        'file': relative_path,
+                        'line': i,
+                        'description': 'Potential hardcoded secret detected',
+                        'suggestion': 'Move secrets to environment variables or secure configuration'
+                    })
+        
+        # Check for SQL injection vulnerabilities
+        for i, line in candidate_lines:
+            for pattern in self.issue_patterns['security']['sql_injection']:
+                if pattern.search(line):
+                    security_issues.append({
+                        'type': 'sql_injection',
+                        'severity': 'critical',
+                        'file': relative_path,
+                        'line': i,
+                        'description': 'Potential SQL injection vulnerability',
+                        'suggestion': 'Use parameterized queries or ORM methods'
+                    })
+        
+        # Check for XSS vulnerabilities
+        for i, line in candidate_lines:
+            for pattern in self.issue_patterns['security']['xss_vulnerabilities']:
+                if pattern.search(line):
+                    security_issues.append({
+                        'type': 'xss_vulnerability',
+                        'severity': 'high',
+                        'file': relative_path,
+                        'line': i,
+                        'description': 'Potential XSS vulnerability',
+                        'suggestion': 'Sanitize user input and use safe DOM manipulation methods'
+                    })
         
         return security_issues
     
-    def _detect_code_quality_issues(self, repo_path: str) -> List[Dict[str, Any]]:
-        """Detect code quality issues"""
+    def _scan_code_quality(self, content: str, relative_path: str,
+                           python_defs: Optional[List[Tuple[str, str, int, int, bool]]] = None,
+                           candidates: Optional[Dict[str, List[Tuple[int, str]]]] = None) -> List[Dict[str, Any]]:
+        """Detect code quality issues in one file"""
         quality_issues = []
         
-        for root, dirs, files in os.walk(repo_path):
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
-            
-            for file in files:
-                if file.endswith(('.py', '.js', '.ts', '.java', '.cs')):
-                    file_path = os.path.join(root, file)
-                    relative_path = os.path.relpath(file_path, repo_path)
-                    
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read()
-                            lines = content.split('\n')
-                            
-                            # Check for long functions
-                            function_lines = self._count_function_lines(lines, file)
-                            for func_name, line_count, start_line in function_lines:
-                                if line_count > self.issue_patterns['code_quality']['long_functions']:
-                                    quality_issues.append({
-                                        'type': 'long_function',
-                                        'severity': 'medium',
-                                        'file': relative_path,
-                                        'line': start_line,
-                                        'description': f'Function "{func_name}" has {line_count} lines',
-                                        'suggestion': 'Consider breaking down into smaller functions'
-                                    })
-                            
-                            # Check for TODO comments
-                            for i, line in enumerate(lines, 1):
-                                if re.search(self.issue_patterns['code_quality']['todo_comments'], line):
-                                    quality_issues.append({
-                                        'type': 'todo_comment',
-                                        'severity': 'low',
-                                        'file': relative_path,
-                                        'line': i,
-                                        'description': 'TODO/FIXME comment found',
-                                        'suggestion': 'Address pending tasks or create proper issues'
-                                    })
-                            
-                            # Check for magic numbers
-                            for i, line in enumerate(lines, 1):
-                                matches = re.findall(self.issue_patterns['code_quality']['magic_numbers'], line)
-                                if matches and not re.search(r'#.*\d+', line):  # Ignore comments
-                                    quality_issues.append({
-                                        'type': 'magic_number',
-                                        'severity': 'low',
-                                        'file': relative_path,
-                                        'line': i,
-                                        'description': f'Magic number(s) found: {", ".join(matches)}',
-                                        'suggestion': 'Replace with named constants'
-                                    })
-                    except:
-                        continue
+        # Check for long functions
+        if python_defs is not None:
+            function_lines = [(name, length, line) for kind, name, line, length, _ in python_defs if kind == 'function']
+        else:
+            function_lines = self._count_function_lines(content.split('\n'), relative_path)
+        for func_name, line_count, start_line in function_lines:
+            if line_count > self.issue_patterns['code_quality']['long_functions']:
+                quality_issues.append({
+                    'type': 'long_function',
+                    'severity': 'medium',
+                    'file': relative_path,
+                    'line': start_line,
+                    'description': f'Function "{func_name}" has {line_count} lines',
+                    'suggestion': 'Consider breaking down into smaller functions'
+                })
+        
+        # Check for TODO comments
+        for i, _ in self._candidate_lines('todo_comments', content, candidates):
+            quality_issues.append({
+                'type': 'todo_comment',
+                'severity': 'low',
+                'file': relative_path,
+                'line': i,
+                'description': 'TODO/FIXME comment found',
+                'suggestion': 'Address pending tasks or create proper issues'
+            })
+        
+        # Check for magic numbers
+        for i, line in self._candidate_lines('magic_numbers', content, candidates):
+            matches = self.issue_patterns['code_quality']['magic_numbers'].findall(line)
+            if matches and not ('#' in line and _COMMENT_WITH_NUMBER.search(line)):  # Ignore comments
+                quality_issues.append({
+                    'type': 'magic_number',
+                    'severity': 'low',
+                    'file': relative_path,
+                    'line': i,
+                    'description': f'Magic number(s) found: {", ".join(matches)}',
+                    'suggestion': 'Replace with named constants'
+                })
         
         return quality_issues
     
-    def _detect_documentation_issues(self, repo_path: str, repo_info: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Detect documentation-related issues"""
+    def _scan_docstrings(self, content: str, relative_path: str,
+                         python_defs: Optional[List[Tuple[str, str, int, int, bool]]] = None,
+                         candidates: Optional[Dict[str, List[Tuple[int, str]]]] = None) -> List[Dict[str, Any]]:
+        """Report public Python classes and functions without docstrings in one file"""
+        if python_defs is None:
+            python_defs = self._python_defs_by_line(content)
+        return [{
+            'type': 'missing_docstring',
+            'severity': 'low',
+            'file': relative_path,
+            'line': line,
+            'description': f'Missing docstring for {kind}: {name}',
+            'suggestion': 'Add comprehensive docstrings following PEP 257'
+        } for kind, name, line, _, has_docstring in python_defs
+            if not has_docstring and (kind == 'class' or not name.startswith('_'))]
+    
+    def _python_defs_by_line(self, content: str) -> List[Tuple[str, str, int, int, bool]]:
+        """Line-based stand-in for _analyze_python's definitions when a file does not parse (lengths unknown)"""
+        lines = content.split('\n')
+        definitions = []
+        for i, line in enumerate(lines):
+            stripped = line.strip()
+            if stripped.startswith(('class ', 'def ')) and ':' in stripped:
+                keyword, _, rest = stripped.partition(' ')
+                # A docstring counts if one of the next three lines opens one
+                has_docstring = any(following.lstrip().startswith(('"""', "'''")) for following in lines[i + 1:i + 4])
+                definitions.append(('class' if keyword == 'class' else 'function', rest.split('(')[0].strip(),
+                                    i + 1, 0, has_docstring))
+        return definitions
+    
+    def _scan_performance(self, content: str, relative_path: str,
+                          python_defs: Optional[List[Tuple[str, str, int, int, bool]]] = None,
+                          candidates: Optional[Dict[str, List[Tuple[int, str]]]] = None) -> List[Dict[str, Any]]:
+        """Detect potential performance issues in one file"""
+        performance_issues = []
+        candidate_lines = self._candidate_lines('performance', content, candidates)
+        
+        # Check for inefficient loops
+        for i, line in candidate_lines:
+            for pattern in self.issue_patterns['performance']['inefficient_loops']:
+                if pattern.search(line):
+                    performance_issues.append({
+                        'type': 'inefficient_loop',
+                        'severity': 'medium',
+                        'file': relative_path,
+                        'line': i,
+                        'description': 'Potentially inefficient loop pattern',
+                        'suggestion': 'Consider using enumerate() or direct iteration'
+                    })
+        
+        # Check for potential memory leaks
+        for i, line in candidate_lines:
+            for pattern in self.issue_patterns['performance']['memory_leaks']:
+                if pattern.search(line):
+                    performance_issues.append({
+                        'type': 'memory_leak_risk',
+                        'severity': 'medium',
+                        'file': relative_path,
+                        'line': i,
+                        'description': 'Potential memory leak: global mutable default',
+                        'suggestion': 'Use None as default and initialize inside function'
+                    })
+        
+        return performance_issues
+    
+    def _detect_documentation_issues(self, root_entries: Dict[str, bool], repo_info: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Detect repository-level documentation issues (docstrings are checked per file)"""
         doc_issues = []
         
         # Check for README
         readme_files = ['README.md', 'README.rst', 'README.txt', 'README']
-        has_readme = any(os.path.exists(os.path.join(repo_path, readme)) for readme in readme_files)
+        has_readme = any(readme in root_entries for readme in readme_files)
         
         if not has_readme:
             doc_issues.append({
@@ -240,7 +723,7 @@ class IssueDetector:
         
         # Check for LICENSE
         license_files = ['LICENSE', 'LICENSE.md', 'LICENSE.txt', 'COPYING']
-        has_license = any(os.path.exists(os.path.join(repo_path, license_file)) for license_file in license_files)
+        has_license = any(license_file in root_entries for license_file in license_files)
         
         if not has_license and not repo_info.get('license'):
             doc_issues.append({
@@ -253,7 +736,10 @@ class IssueDetector:
         
         # Check for API documentation
         api_doc_files = ['docs/', 'documentation/', 'api/', 'swagger.yaml', 'openapi.yaml']
-        has_api_docs = any(os.path.exists(os.path.join(repo_path, doc_path)) for doc_path in api_doc_files)
+        has_api_docs = any(
+            root_entries.get(doc_path.rstrip('/')) if doc_path.endswith('/') else doc_path in root_entries
+            for doc_path in api_doc_files
+        )
         
         if not has_api_docs:
             doc_issues.append({
@@ -264,92 +750,19 @@ class IssueDetector:
                 'suggestion': 'Consider adding API documentation using tools like Swagger/OpenAPI'
             })
         
-        # Check for missing docstrings in Python files
-        for root, dirs, files in os.walk(repo_path):
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
-            
-            for file in files:
-                if file.endswith('.py'):
-                    file_path = os.path.join(root, file)
-                    relative_path = os.path.relpath(file_path, repo_path)
-                    
-                    missing_docstrings = self._check_python_docstrings(file_path)
-                    for item in missing_docstrings:
-                        doc_issues.append({
-                            'type': 'missing_docstring',
-                            'severity': 'low',
-                            'file': relative_path,
-                            'line': item['line'],
-                            'description': f'Missing docstring for {item["type"]}: {item["name"]}',
-                            'suggestion': 'Add comprehensive docstrings following PEP 257'
-                        })
-        
         return doc_issues
     
-    def _detect_performance_issues(self, repo_path: str) -> List[Dict[str, Any]]:
-        """Detect potential performance issues"""
-        performance_issues = []
-        
-        for root, dirs, files in os.walk(repo_path):
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
-            
-            for file in files:
-                if file.endswith(('.py', '.js', '.ts')):
-                    file_path = os.path.join(root, file)
-                    relative_path = os.path.relpath(file_path, repo_path)
-                    
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read()
-                            lines = content.split('\n')
-                            
-                            # Check for inefficient loops
-                            for i, line in enumerate(lines, 1):
-                                for pattern in self.issue_patterns['performance']['inefficient_loops']:
-                                    if re.search(pattern, line):
-                                        performance_issues.append({
-                                            'type': 'inefficient_loop',
-                                            'severity': 'medium',
-                                            'file': relative_path,
-                                            'line': i,
-                                            'description': 'Potentially inefficient loop pattern',
-                                            'suggestion': 'Consider using enumerate() or direct iteration'
-                                        })
-                            
-                            # Check for potential memory leaks
-                            for i, line in enumerate(lines, 1):
-                                for pattern in self.issue_patterns['performance']['memory_leaks']:
-                                    if re.search(pattern, line):
-                                        performance_issues.append({
-                                            'type': 'memory_leak_risk',
-                                            'severity': 'medium',
-                                            'file': relative_path,
-                                            'line': i,
-                                            'description': 'Potential memory leak: global mutable default',
-                                            'suggestion': 'Use None as default and initialize inside function'
-                                        })
-                    except:
-                        continue
-        
-        return performance_issues
-    
-    def _detect_dependency_issues(self, repo_path: str) -> List[Dict[str, Any]]:
+    def _detect_dependency_issues(self, root_entries: Dict[str, bool], source_files: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
         """Detect dependency-related issues"""
         dependency_issues = []
         
         # Check Python dependencies
         requirements_files = ['requirements.txt', 'setup.py', 'pyproject.toml', 'Pipfile']
-        python_deps = None
-        
-        for req_file in requirements_files:
-            req_path = os.path.join(repo_path, req_file)
-            if os.path.exists(req_path):
-                python_deps = req_file
-                break
+        python_deps = next((req_file for req_file in requirements_files if req_file in root_entries), None)
         
         if not python_deps:
             # Check if Python files exist
-            has_python = any(file.endswith('.py') for root, dirs, files in os.walk(repo_path) for file in files)
+            has_python = any(os.path.splitext(file_path)[1] == '.py' for file_path, _ in source_files)
             if has_python:
                 dependency_issues.append({
                     'type': 'missing_requirements',
@@ -360,30 +773,21 @@ class IssueDetector:
                 })
         
         # Check JavaScript dependencies
-        package_json_path = os.path.join(repo_path, 'package.json')
-        if os.path.exists(package_json_path):
-            try:
-                with open(package_json_path, 'r') as f:
-                    package_data = json.loads(f.read())
-                    
-                # Check for missing package-lock.json or yarn.lock
-                has_lockfile = (os.path.exists(os.path.join(repo_path, 'package-lock.json')) or 
-                               os.path.exists(os.path.join(repo_path, 'yarn.lock')))
-                
-                if not has_lockfile:
-                    dependency_issues.append({
-                        'type': 'missing_lockfile',
-                        'severity': 'medium',
-                        'file': 'package.json',
-                        'description': 'No lock file found for JavaScript dependencies',
-                        'suggestion': 'Commit package-lock.json or yarn.lock for reproducible builds'
-                    })
-            except:
-                pass
+        if 'package.json' in root_entries:
+            # Check for missing package-lock.json or yarn.lock
+            has_lockfile = 'package-lock.json' in root_entries or 'yarn.lock' in root_entries
+            
+            if not has_lockfile:
+                dependency_issues.append({
+                    'type': 'missing_lockfile',
+                    'severity': 'medium',
+                    'file': 'package.json',
+                    'description': 'No lock file found for JavaScript dependencies',
+                    'suggestion': 'Commit package-lock.json or yarn.lock for reproducible builds'
+                })
         else:
             # Check if JavaScript files exist
-            has_js = any(file.endswith(('.js', '.ts', '.jsx', '.tsx')) 
-                        for root, dirs, files in os.walk(repo_path) for file in files)
+            has_js = any(os.path.splitext(file_path)[1] in _JS_EXTENSIONS for file_path, _ in source_files)
             if has_js:
                 dependency_issues.append({
                     'type': 'missing_package_json',
@@ -395,15 +799,12 @@ class IssueDetector:
         
         return dependency_issues
     
-    def _detect_structure_issues(self, repo_path: str) -> List[Dict[str, Any]]:
+    def _detect_structure_issues(self, root_entries: Dict[str, bool]) -> List[Dict[str, Any]]:
         """Detect project structure issues"""
         structure_issues = []
         
-        # Check for proper project structure
-        root_files = os.listdir(repo_path)
-        
         # Check for scattered files in root
-        code_files_in_root = [f for f in root_files if f.endswith(('.py', '.js', '.ts', '.java', '.cs'))]
+        code_files_in_root = [f for f in root_entries if os.path.splitext(f)[1] in _QUALITY_EXTENSIONS]
         if len(code_files_in_root) > 3:  # Allow a few main files
             structure_issues.append({
                 'type': 'scattered_files',
@@ -414,7 +815,7 @@ class IssueDetector:
             })
         
         # Check for missing .gitignore
-        if '.gitignore' not in root_files:
+        if '.gitignore' not in root_entries:
             structure_issues.append({
                 'type': 'missing_gitignore',
                 'severity': 'low',
@@ -425,7 +826,7 @@ class IssueDetector:
         
         # Check for appropriate directory structure
         common_dirs = ['src', 'lib', 'tests', 'test', 'docs', 'documentation']
-        has_organized_structure = any(d in root_files for d in common_dirs)
+        has_organized_structure = any(d in root_entries for d in common_dirs)
         
         if not has_organized_structure and len(code_files_in_root) > 5:
             structure_issues.append({
@@ -446,9 +847,8 @@ class IssueDetector:
         last_updated = repo_info.get('stats', {}).get('updated_at')
         if last_updated:
             try:
-                from datetime import datetime
-                last_update_date = datetime.strptime(last_updated.split('T')[0], '%Y-%m-%d')
-                days_since_update = (datetime.now() - last_update_date).days
+                last_update_date = date.fromisoformat(last_updated.split('T')[0])
+                days_since_update = (date.today() - last_update_date).days
                 
                 if days_since_update > 365:
                     maintenance_issues.append({
@@ -482,6 +882,33 @@ class IssueDetector:
         
         return maintenance_issues
     
+    def _analyze_python(self, content: str) -> Optional[List[Tuple[str, str, int, int, bool]]]:
+        """Parse Python source once; returns (kind, name, line, length, has_docstring) per class and function
+        
+        kind is 'class' or 'function' (including async and nested functions), ordered by line.
+        Returns None when the file does not parse; function lengths then fall back to the line-based counter.
+        """
+        try:
+            tree = ast.parse(content)
+        except (SyntaxError, ValueError, RecursionError, MemoryError):
+            return None
+        
+        # Definitions only ever appear in statement blocks, so walk those and skip expression subtrees
+        definitions = []
+        pending = [tree.body]
+        while pending:
+            for node in pending.pop():
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                    kind = 'class' if isinstance(node, ast.ClassDef) else 'function'
+                    definitions.append((kind, node.name, node.lineno, node.end_lineno - node.lineno + 1,
+                                        ast.get_docstring(node, clean=False) is not None))
+                for field in _STATEMENT_BLOCK_FIELDS:
+                    block = getattr(node, field, None)
+                    if block:
+                        pending.append(block)
+        definitions.sort(key=lambda definition: definition[2])
+        return definitions
+    
     def _count_function_lines(self, lines: List[str], filename: str) -> List[tuple]:
         """Count lines in functions for different languages"""
         function_data = []
@@ -541,7 +968,7 @@ class IssueDetector:
                 if current_function is None:
                     # Extract function name
                     if 'function ' in stripped:
-                        func_match = re.search(r'function\s+(\w+)', stripped)
+                        func_match = _JS_FUNCTION_NAME.search(stripped)
                         current_function = func_match.group(1) if func_match else 'anonymous'
                     else:
                         current_function = 'arrow_function'
@@ -560,54 +987,6 @@ class IssueDetector:
         
         return functions
     
-    def _check_python_docstrings(self, file_path: str) -> List[Dict[str, Any]]:
-        """Check for missing docstrings in Python files"""
-        missing_docstrings = []
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-            
-            for i, line in enumerate(lines):
-                stripped = line.strip()
-                
-                # Check for class definitions
-                if stripped.startswith('class ') and ':' in stripped:
-                    class_name = stripped.split('(')[0].replace('class ', '').strip()
-                    if not self._has_docstring(lines, i + 1):
-                        missing_docstrings.append({
-                            'type': 'class',
-                            'name': class_name,
-                            'line': i + 1
-                        })
-                
-                # Check for function definitions
-                elif stripped.startswith('def ') and ':' in stripped:
-                    func_name = stripped.split('(')[0].replace('def ', '').strip()
-                    if not func_name.startswith('_') and not self._has_docstring(lines, i + 1):
-                        missing_docstrings.append({
-                            'type': 'function',
-                            'name': func_name,
-                            'line': i + 1
-                        })
-        except:
-            pass
-        
-        return missing_docstrings
-    
-    def _has_docstring(self, lines: List[str], start_line: int) -> bool:
-        """Check if there's a docstring after the definition"""
-        if start_line >= len(lines):
-            return False
-        
-        # Look for docstring in next few lines
-        for i in range(start_line, min(start_line + 3, len(lines))):
-            stripped = lines[i].strip()
-            if stripped.startswith('"""') or stripped.startswith("'''"):
-                return True
-        
-        return False
-    
     def _calculate_severity_summary(self, issues: Dict[str, Any]) -> Dict[str, int]:
         """Calculate summary of issue severities"""
         severity_counts = {'critical': 0, 'high': 0, 'medium': 0, 'low': 0}
@@ -624,77 +1003,19 @@ class IssueDetector:
     
     def _generate_action_items(self, issues: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate prioritized action items based on detected issues"""
-        action_items = []
-        
-        # Security issues - highest priority
-        security_issues = issues.get('security_issues', [])
-        if security_issues:
-            critical_security = [i for i in security_issues if i.get('severity') == 'critical']
-            if critical_security:
-                action_items.append({
-                    'priority': 1,
-                    'category': 'Security',
-                    'title': 'Address Critical Security Issues',
-                    'description': f'Found {len(critical_security)} critical security issues',
-                    'action': 'Immediately review and fix hardcoded secrets, SQL injection, and XSS vulnerabilities',
-                    'impact': 'High - Security vulnerabilities can lead to data breaches'
-                })
-        
-        # Test coverage - high priority
-        coverage_issues = []
-        for category in ['code_quality_issues', 'structure_issues']:
-            coverage_issues.extend([i for i in issues.get(category, []) if 'test' in i.get('description', '').lower()])
-        
-        if coverage_issues:
-            action_items.append({
-                'priority': 2,
-                'category': 'Testing',
-                'title': 'Improve Test Coverage',
-                'description': 'Low test coverage detected',
-                'action': 'Add unit tests for core functionality and critical business logic',
-                'impact': 'Medium - Poor test coverage increases bug risk'
-            })
-        
-        # Documentation - medium priority
-        doc_issues = issues.get('documentation_issues', [])
-        if doc_issues:
-            action_items.append({
-                'priority': 3,
-                'category': 'Documentation',
-                'title': 'Improve Documentation',
-                'description': f'Found {len(doc_issues)} documentation issues',
-                'action': 'Add README, license, and code documentation',
-                'impact': 'Medium - Poor documentation reduces maintainability'
-            })
-        
-        # Code quality - medium priority
-        quality_issues = issues.get('code_quality_issues', [])
-        if quality_issues:
-            high_impact_quality = [i for i in quality_issues if i.get('type') in ['long_function', 'deep_nesting']]
-            if high_impact_quality:
-                action_items.append({
-                    'priority': 4,
-                    'category': 'Code Quality',
-                    'title': 'Refactor Complex Code',
-                    'description': f'Found {len(high_impact_quality)} complex code issues',
-                    'action': 'Break down long functions and reduce nesting complexity',
-                    'impact': 'Medium - Complex code is harder to maintain and debug'
-                })
-        
-        # Dependencies - lower priority
-        dep_issues = issues.get('dependency_issues', [])
-        if dep_issues:
-            action_items.append({
-                'priority': 5,
-                'category': 'Dependencies',
-                'title': 'Improve Dependency Management',
-                'description': f'Found {len(dep_issues)} dependency issues',
-                'action': 'Add proper dependency management files and lock files',
-                'impact': 'Low - Improves build reproducibility'
-            })
-        
-        return action_items
-    
+        context = {
+            'critical_security': sum(1 for i in issues.get('security_issues', []) if i.get('severity') == 'critical'),
+            'test_issues': any('test' in i.get('description', '').lower()
+                               for category in ('code_quality_issues', 'structure_issues')
+                               for i in issues.get(category, [])),
+            'doc_issues': len(issues.get('documentation_issues', [])),
+            'complex_code': sum(1 for i in issues.get('code_quality_issues', [])
+                                if i.get('type') in _COMPLEX_CODE_TYPES),
+            'dependency_issues': len(issues.get('dependency_issues', []))
+        }
+        return [{**template, **fields(context)} for applies, template, fields in _ACTION_ITEM_RULES
+                if applies(context)]
+
     def merge_veracode_issues(self, existing_issues: Dict[str, Any], 
                              veracode_analysis: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -719,11 +1040,12 @@ class IssueDetector:
         # Add Veracode issues to security issues
         merged_security_issues = existing_security_issues + veracode_security_issues
         
-        # Update the issues dictionary
-        updated_issues = existing_issues.copy()
-        updated_issues['security_issues'] = merged_security_issues
-        updated_issues['veracode_security_issues'] = veracode_security_issues
-        updated_issues['veracode_analysis_available'] = True
+        # Build the updated issues dictionary in one merge, leaving existing_issues untouched
+        updated_issues = existing_issues | {
+            'security_issues': merged_security_issues,
+            'veracode_security_issues': veracode_security_issues,
+            'veracode_analysis_available': True
+        }
         
         # Recalculate severity summary with Veracode findings
         updated_issues['severity_summary'] = self._calculate_severity_summary(updated_issues)
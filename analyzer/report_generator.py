@@ -1,80 +1,208 @@
 from typing import Dict, Any, List
+from collections import Counter
 from datetime import datetime
-import json
+from bisect import bisect_right
+
+
+# Report rules as (applies, template, fields) triples over a per-report context dict, listed in
+# output order. Templates hold the invariant keys (each report gets its own copy of the action
+# lists); fields(ctx) supplies the per-report ones.
+_RECOMMENDATION_RULES = (
+    # Test coverage recommendations
+    (lambda ctx: ctx['coverage'] < 50, {
+        'category': 'Testing',
+        'priority': 'High',
+        'title': 'Implement Comprehensive Testing Strategy',
+        'actions': [
+            'Add unit tests for core business logic',
+            'Implement integration tests for key workflows',
+            'Set up automated test running in CI/CD pipeline',
+            'Aim for minimum 75% test coverage'
+        ],
+        'estimated_effort': 'High',
+        'impact': 'High'
+    }, lambda ctx: {
+        'description': f'Current test coverage is {ctx["coverage"]}%, which is below acceptable standards.'
+    }),
+    (lambda ctx: 50 <= ctx['coverage'] < 75, {
+        'category': 'Testing',
+        'priority': 'Medium',
+        'title': 'Improve Test Coverage',
+        'actions': [
+            'Identify and test uncovered code paths',
+            'Add edge case testing',
+            'Implement boundary condition tests'
+        ],
+        'estimated_effort': 'Medium',
+        'impact': 'Medium'
+    }, lambda ctx: {
+        'description': f'Test coverage at {ctx["coverage"]}% could be improved.'
+    }),
+    # Security recommendations
+    (lambda ctx: ctx['critical_security'], {
+        'category': 'Security',
+        'priority': 'Critical',
+        'title': 'Address Critical Security Vulnerabilities',
+        'actions': [
+            'Remove hardcoded secrets and use environment variables',
+            'Implement parameterized queries to prevent SQL injection',
+            'Sanitize user inputs to prevent XSS attacks',
+            'Conduct security code review'
+        ],
+        'estimated_effort': 'Medium',
+        'impact': 'Critical'
+    }, lambda ctx: {
+        'description': f'Found {ctx["critical_security"]} critical security issues.'
+    }),
+    # Documentation recommendations
+    (lambda ctx: ctx['doc_issues'], {
+        'category': 'Documentation',
+        'priority': 'Medium',
+        'title': 'Improve Project Documentation',
+        'actions': [
+            'Add comprehensive README with setup instructions',
+            'Include API documentation',
+            'Add code comments and docstrings',
+            'Create contributor guidelines'
+        ],
+        'estimated_effort': 'Low',
+        'impact': 'Medium'
+    }, lambda ctx: {
+        'description': f'Found {ctx["doc_issues"]} documentation issues.'
+    }),
+    # Code quality recommendations
+    (lambda ctx: ctx['long_functions'], {
+        'category': 'Code Quality',
+        'priority': 'Medium',
+        'title': 'Refactor Complex Functions',
+        'actions': [
+            'Break down long functions into smaller, focused functions',
+            'Apply single responsibility principle',
+            'Improve code readability and maintainability'
+        ],
+        'estimated_effort': 'Medium',
+        'impact': 'Medium'
+    }, lambda ctx: {
+        'description': f'Found {ctx["long_functions"]} functions that are too long.'
+    })
+)
+
+_IMPROVEMENT_AREA_RULES = (
+    # Test coverage improvements
+    (lambda ctx: ctx['coverage'] < 75, {
+        'area': 'Test Coverage',
+        'target_score': 80,
+        'description': 'Increase automated test coverage for better code reliability',
+        'key_actions': [
+            'Add unit tests for core functionality',
+            'Implement integration testing',
+            'Set up continuous testing pipeline'
+        ]
+    }, lambda ctx: {
+        'current_score': ctx['coverage'],
+        'priority': 'High' if ctx['coverage'] < 50 else 'Medium'
+    }),
+    # Security improvements
+    (lambda ctx: ctx['security_issues'], {
+        'area': 'Security',
+        'target_score': 95,
+        'description': 'Address security vulnerabilities and implement secure coding practices',
+        'key_actions': [
+            'Fix critical security issues immediately',
+            'Implement secure coding guidelines',
+            'Add security testing to CI/CD pipeline'
+        ]
+    }, lambda ctx: {
+        'current_score': max(0, 100 - ctx['security_issues'] * 10),
+        'priority': 'Critical' if ctx['critical_security'] > 0 else 'High'
+    }),
+    # Documentation improvements
+    (lambda ctx: ctx['doc_issues'] > 2, {
+        'area': 'Documentation',
+        'target_score': 85,
+        'priority': 'Medium',
+        'description': 'Improve project documentation for better maintainability',
+        'key_actions': [
+            'Add comprehensive README',
+            'Document API endpoints',
+            'Include setup and deployment guides'
+        ]
+    }, lambda ctx: {
+        'current_score': max(0, 100 - ctx['doc_issues'] * 10)
+    })
+)
+
+# Score bands: bisect_right over the lower bounds picks the (label, color) for a score
+_STATUS_THRESHOLDS = (40, 60, 80)
+_STATUS_LEVELS = (('Needs Improvement', 'red'), ('Fair', 'orange'), ('Good', 'blue'), ('Excellent', 'green'))
+_COVERAGE_THRESHOLDS = (50, 75, 90)
+_COVERAGE_LEVELS = (('Poor', 'red'), ('Fair', 'orange'), ('Good', 'blue'), ('Excellent', 'green'))
+
+# Code quality severities listed as major issues
+_MAJOR_SEVERITIES = frozenset({'critical', 'high'})
+
 
 class ReportGenerator:
     """Generates comprehensive analysis reports"""
     
-    def __init__(self):
-        self.report_template = {
-            'metadata': {},
-            'summary': {},
-            'test_analysis': {},
-            'issues_analysis': {},
-            'recommendations': {},
-            'scores': {}
-        }
-    
     def generate_report(self, repo_info: Dict[str, Any], coverage_results: Dict[str, Any], 
                        issues: Dict[str, Any]) -> Dict[str, Any]:
         """Generate comprehensive analysis report"""
         
+        # Several sections need security issue counts by severity; count them once
+        security_counts = self._count_security_severities(issues)
+        coverage = (coverage_results.get('coverage_metrics') or {}).get('overall', 0)
+        scores = self._calculate_scores(coverage, issues, security_counts)
+        
         report = {
             'metadata': self._generate_metadata(repo_info),
-            'summary': self._generate_summary(repo_info, coverage_results, issues),
+            'summary': self._generate_summary(repo_info, coverage_results, coverage, issues, security_counts, scores),
             'test_analysis': self._generate_test_analysis(coverage_results),
-            'issues_analysis': self._generate_issues_analysis(issues),
-            'recommendations': self._generate_recommendations(coverage_results, issues),
-            'scores': self._calculate_scores(coverage_results, issues),
-            'improvement_areas': self._identify_improvement_areas(coverage_results, issues),
+            'issues_analysis': self._generate_issues_analysis(issues, security_counts),
+            'recommendations': self._generate_recommendations(coverage, issues, security_counts),
+            'scores': scores,
+            'improvement_areas': self._identify_improvement_areas(coverage, issues, security_counts),
             'action_plan': self._create_action_plan(issues)
         }
         
         return report
     
+    def _count_security_severities(self, issues: Dict[str, Any]) -> Counter:
+        """Count security issues per severity in a single pass"""
+        return Counter(issue.get('severity') for issue in issues.get('security_issues', []))
+    
     def _generate_metadata(self, repo_info: Dict[str, Any]) -> Dict[str, Any]:
         """Generate report metadata"""
+        languages = repo_info.get('languages') or {}
+        stats = repo_info.get('stats') or {}
         return {
             'repository': repo_info.get('full_name', 'Unknown'),
             'description': repo_info.get('description', 'No description available'),
             'url': repo_info.get('url', ''),
-            'primary_language': repo_info.get('languages', {}).get('primary', 'Unknown'),
-            'languages': list(repo_info.get('languages', {}).keys()),
-            'stars': repo_info.get('stats', {}).get('stars', 0),
-            'forks': repo_info.get('stats', {}).get('forks', 0),
+            'primary_language': languages.get('primary', 'Unknown'),
+            'languages': list(languages.keys()),
+            'stars': stats.get('stars', 0),
+            'forks': stats.get('forks', 0),
             'contributors': repo_info.get('contributors_count', 0),
-            'last_updated': repo_info.get('stats', {}).get('updated_at', ''),
+            'last_updated': stats.get('updated_at', ''),
             'analysis_date': datetime.now().isoformat(),
             'license': repo_info.get('license', 'Not specified')
         }
     
     def _generate_summary(self, repo_info: Dict[str, Any], coverage_results: Dict[str, Any], 
-                         issues: Dict[str, Any]) -> Dict[str, Any]:
+                         coverage: float, issues: Dict[str, Any], security_counts: Counter,
+                         scores: Dict[str, Any]) -> Dict[str, Any]:
         """Generate executive summary"""
         
-        # Calculate overall health score
-        health_score = self._calculate_health_score(coverage_results, issues)
+        # Overall health score comes from the scores computed once per report
+        health_score = scores['health_score']
         
         # Count issues by severity
         severity_summary = issues.get('severity_summary', {})
         total_issues = sum(severity_summary.values())
         
-        # Get test coverage
-        coverage = coverage_results.get('coverage_metrics', {}).get('overall', 0)
-        
         # Determine status
-        if health_score >= 80:
-            status = 'Excellent'
-            status_color = 'green'
-        elif health_score >= 60:
-            status = 'Good'
-            status_color = 'blue'
-        elif health_score >= 40:
-            status = 'Fair'
-            status_color = 'orange'
-        else:
-            status = 'Needs Improvement'
-            status_color = 'red'
+        status, status_color = _STATUS_LEVELS[bisect_right(_STATUS_THRESHOLDS, health_score)]
         
         return {
             'health_score': health_score,
@@ -87,7 +215,7 @@ class ReportGenerator:
             'medium_issues': severity_summary.get('medium', 0),
             'low_issues': severity_summary.get('low', 0),
             'test_files_count': coverage_results.get('test_files_count', 0),
-            'primary_concerns': self._identify_primary_concerns(coverage_results, issues)
+            'primary_concerns': self._identify_primary_concerns(coverage, issues, security_counts)
         }
     
     def _generate_test_analysis(self, coverage_results: Dict[str, Any]) -> Dict[str, Any]:
@@ -98,18 +226,7 @@ class ReportGenerator:
         
         # Determine coverage level
         overall_coverage = metrics.get('overall', 0)
-        if overall_coverage >= 90:
-            coverage_level = 'Excellent'
-            coverage_color = 'green'
-        elif overall_coverage >= 75:
-            coverage_level = 'Good'
-            coverage_color = 'blue'
-        elif overall_coverage >= 50:
-            coverage_level = 'Fair'
-            coverage_color = 'orange'
-        else:
-            coverage_level = 'Poor'
-            coverage_color = 'red'
+        coverage_level, coverage_color = _COVERAGE_LEVELS[bisect_right(_COVERAGE_THRESHOLDS, overall_coverage)]
         
         return {
             'coverage_metrics': {
@@ -133,153 +250,75 @@ class ReportGenerator:
             'recommendations': coverage_results.get('recommendations', [])
         }
     
-    def _generate_issues_analysis(self, issues: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_issues_analysis(self, issues: Dict[str, Any], security_counts: Counter) -> Dict[str, Any]:
         """Generate detailed issues analysis"""
         
+        security_issues = issues.get('security_issues', [])
+        quality_issues = issues.get('code_quality_issues', [])
+        doc_issues = issues.get('documentation_issues', [])
+        performance_issues = issues.get('performance_issues', [])
+        dependency_issues = issues.get('dependency_issues', [])
+        structure_issues = issues.get('structure_issues', [])
+        maintenance_issues = issues.get('maintenance_issues', [])
+        
         return {
             'security': {
-                'count': len(issues.get('security_issues', [])),
-                'issues': issues.get('security_issues', []),
-                'critical_count': len([i for i in issues.get('security_issues', []) 
-                                     if i.get('severity') == 'critical'])
+                'count': len(security_issues),
+                'issues': security_issues,
+                'critical_count': security_counts['critical']
             },
             'code_quality': {
-                'count': len(issues.get('code_quality_issues', [])),
-                'issues': issues.get('code_quality_issues', []),
-                'major_issues': [i for i in issues.get('code_quality_issues', []) 
-                               if i.get('severity') in ['critical', 'high']]
+                'count': len(quality_issues),
+                'issues': quality_issues,
+                'major_issues': [i for i in quality_issues 
+                               if i.get('severity') in _MAJOR_SEVERITIES]
             },
             'documentation': {
-                'count': len(issues.get('documentation_issues', [])),
-                'issues': issues.get('documentation_issues', []),
-                'missing_items': [i['type'] for i in issues.get('documentation_issues', [])]
+                'count': len(doc_issues),
+                'issues': doc_issues,
+                'missing_items': [i['type'] for i in doc_issues]
             },
             'performance': {
-                'count': len(issues.get('performance_issues', [])),
-                'issues': issues.get('performance_issues', [])
+                'count': len(performance_issues),
+                'issues': performance_issues
             },
             'dependencies': {
-                'count': len(issues.get('dependency_issues', [])),
-                'issues': issues.get('dependency_issues', [])
+                'count': len(dependency_issues),
+                'issues': dependency_issues
             },
             'structure': {
-                'count': len(issues.get('structure_issues', [])),
-                'issues': issues.get('structure_issues', [])
+                'count': len(structure_issues),
+                'issues': structure_issues
             },
             'maintenance': {
-                'count': len(issues.get('maintenance_issues', [])),
-                'issues': issues.get('maintenance_issues', [])
+                'count': len(maintenance_issues),
+                'issues': maintenance_issues
             }
         }
     
-    def _generate_recommendations(self, coverage_results: Dict[str, Any], 
-                                issues: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _generate_recommendations(self, coverage: float, 
+                                issues: Dict[str, Any], security_counts: Counter) -> List[Dict[str, Any]]:
         """Generate comprehensive recommendations"""
         
-        recommendations = []
-        
-        # Test coverage recommendations
-        coverage = coverage_results.get('coverage_metrics', {}).get('overall', 0)
-        if coverage < 50:
-            recommendations.append({
-                'category': 'Testing',
-                'priority': 'High',
-                'title': 'Implement Comprehensive Testing Strategy',
-                'description': f'Current test coverage is {coverage}%, which is below acceptable standards.',
-                'actions': [
-                    'Add unit tests for core business logic',
-                    'Implement integration tests for key workflows',
-                    'Set up automated test running in CI/CD pipeline',
-                    'Aim for minimum 75% test coverage'
-                ],
-                'estimated_effort': 'High',
-                'impact': 'High'
-            })
-        elif coverage < 75:
-            recommendations.append({
-                'category': 'Testing',
-                'priority': 'Medium',
-                'title': 'Improve Test Coverage',
-                'description': f'Test coverage at {coverage}% could be improved.',
-                'actions': [
-                    'Identify and test uncovered code paths',
-                    'Add edge case testing',
-                    'Implement boundary condition tests'
-                ],
-                'estimated_effort': 'Medium',
-                'impact': 'Medium'
-            })
-        
-        # Security recommendations
-        security_issues = issues.get('security_issues', [])
-        critical_security = [i for i in security_issues if i.get('severity') == 'critical']
-        if critical_security:
-            recommendations.append({
-                'category': 'Security',
-                'priority': 'Critical',
-                'title': 'Address Critical Security Vulnerabilities',
-                'description': f'Found {len(critical_security)} critical security issues.',
-                'actions': [
-                    'Remove hardcoded secrets and use environment variables',
-                    'Implement parameterized queries to prevent SQL injection',
-                    'Sanitize user inputs to prevent XSS attacks',
-                    'Conduct security code review'
-                ],
-                'estimated_effort': 'Medium',
-                'impact': 'Critical'
-            })
-        
-        # Documentation recommendations
-        doc_issues = issues.get('documentation_issues', [])
-        if doc_issues:
-            recommendations.append({
-                'category': 'Documentation',
-                'priority': 'Medium',
-                'title': 'Improve Project Documentation',
-                'description': f'Found {len(doc_issues)} documentation issues.',
-                'actions': [
-                    'Add comprehensive README with setup instructions',
-                    'Include API documentation',
-                    'Add code comments and docstrings',
-                    'Create contributor guidelines'
-                ],
-                'estimated_effort': 'Low',
-                'impact': 'Medium'
-            })
-        
-        # Code quality recommendations
-        quality_issues = issues.get('code_quality_issues', [])
-        if quality_issues:
-            long_functions = [i for i in quality_issues if i.get('type') == 'long_function']
-            if long_functions:
-                recommendations.append({
-                    'category': 'Code Quality',
-                    'priority': 'Medium',
-                    'title': 'Refactor Complex Functions',
-                    'description': f'Found {len(long_functions)} functions that are too long.',
-                    'actions': [
-                        'Break down long functions into smaller, focused functions',
-                        'Apply single responsibility principle',
-                        'Improve code readability and maintainability'
-                    ],
-                    'estimated_effort': 'Medium',
-                    'impact': 'Medium'
-                })
-        
-        return recommendations
+        context = {
+            'coverage': coverage,
+            'critical_security': security_counts['critical'],
+            'doc_issues': len(issues.get('documentation_issues', [])),
+            'long_functions': sum(1 for i in issues.get('code_quality_issues', []) if i.get('type') == 'long_function')
+        }
+        return [{**template, 'actions': list(template['actions']), **fields(context)}
+                for applies, template, fields in _RECOMMENDATION_RULES if applies(context)]
     
-    def _calculate_scores(self, coverage_results: Dict[str, Any], 
-                         issues: Dict[str, Any]) -> Dict[str, Any]:
+    def _calculate_scores(self, coverage: float, 
+                         issues: Dict[str, Any], security_counts: Counter) -> Dict[str, Any]:
         """Calculate various quality scores"""
         
         # Test coverage score
-        coverage = coverage_results.get('coverage_metrics', {}).get('overall', 0)
         coverage_score = min(100, coverage * 1.1)  # Slight boost for good coverage
         
         # Security score
-        security_issues = issues.get('security_issues', [])
-        critical_security = len([i for i in security_issues if i.get('severity') == 'critical'])
-        high_security = len([i for i in security_issues if i.get('severity') == 'high'])
+        critical_security = security_counts['critical']
+        high_security = security_counts['high']
         
         security_score = 100
         security_score -= critical_security * 30  # Critical issues heavily penalized
@@ -310,77 +349,26 @@ class ReportGenerator:
             'code_quality_score': round(code_quality_score, 1)
         }
     
-    def _calculate_health_score(self, coverage_results: Dict[str, Any], 
-                              issues: Dict[str, Any]) -> float:
-        """Calculate overall repository health score"""
-        scores = self._calculate_scores(coverage_results, issues)
-        return scores['health_score']
-    
-    def _identify_improvement_areas(self, coverage_results: Dict[str, Any], 
-                                  issues: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _identify_improvement_areas(self, coverage: float, 
+                                  issues: Dict[str, Any], security_counts: Counter) -> List[Dict[str, Any]]:
         """Identify key areas for improvement"""
         
-        improvement_areas = []
-        
-        # Test coverage improvements
-        coverage = coverage_results.get('coverage_metrics', {}).get('overall', 0)
-        if coverage < 75:
-            improvement_areas.append({
-                'area': 'Test Coverage',
-                'current_score': coverage,
-                'target_score': 80,
-                'priority': 'High' if coverage < 50 else 'Medium',
-                'description': 'Increase automated test coverage for better code reliability',
-                'key_actions': [
-                    'Add unit tests for core functionality',
-                    'Implement integration testing',
-                    'Set up continuous testing pipeline'
-                ]
-            })
-        
-        # Security improvements
-        security_issues = issues.get('security_issues', [])
-        if security_issues:
-            critical_count = len([i for i in security_issues if i.get('severity') == 'critical'])
-            improvement_areas.append({
-                'area': 'Security',
-                'current_score': max(0, 100 - len(security_issues) * 10),
-                'target_score': 95,
-                'priority': 'Critical' if critical_count > 0 else 'High',
-                'description': 'Address security vulnerabilities and implement secure coding practices',
-                'key_actions': [
-                    'Fix critical security issues immediately',
-                    'Implement secure coding guidelines',
-                    'Add security testing to CI/CD pipeline'
-                ]
-            })
-        
-        # Documentation improvements
-        doc_issues = issues.get('documentation_issues', [])
-        if len(doc_issues) > 2:
-            improvement_areas.append({
-                'area': 'Documentation',
-                'current_score': max(0, 100 - len(doc_issues) * 10),
-                'target_score': 85,
-                'priority': 'Medium',
-                'description': 'Improve project documentation for better maintainability',
-                'key_actions': [
-                    'Add comprehensive README',
-                    'Document API endpoints',
-                    'Include setup and deployment guides'
-                ]
-            })
-        
-        return improvement_areas
+        context = {
+            'coverage': coverage,
+            'security_issues': len(issues.get('security_issues', [])),
+            'critical_security': security_counts['critical'],
+            'doc_issues': len(issues.get('documentation_issues', []))
+        }
+        return [{**template, 'key_actions': list(template['key_actions']), **fields(context)}
+                for applies, template, fields in _IMPROVEMENT_AREA_RULES if applies(context)]
     
-    def _identify_primary_concerns(self, coverage_results: Dict[str, Any], 
-                                 issues: Dict[str, Any]) -> List[str]:
+    def _identify_primary_concerns(self, coverage: float, 
+                                 issues: Dict[str, Any], security_counts: Counter) -> List[str]:
         """Identify primary concerns for the repository"""
         
         concerns = []
         
         # Check test coverage
-        coverage = coverage_results.get('coverage_metrics', {}).get('overall', 0)
         if coverage < 30:
             concerns.append('Very low test coverage')
         elif coverage < 50:
@@ -388,8 +376,7 @@ class ReportGenerator:
         
         # Check security issues
         security_issues = issues.get('security_issues', [])
-        critical_security = [i for i in security_issues if i.get('severity') == 'critical']
-        if critical_security:
+        if security_counts['critical']:
             concerns.append('Critical security vulnerabilities')
         elif len(security_issues) > 3:
             concerns.append('Multiple security issues')
@@ -5,7 +5,11 @@ A single application supporting both standard and AI-enhanced analysis modes
 
 import os
 import asyncio
+import atexit
 import logging
+import logging.handlers
+import queue
+import threading
 from datetime import datetime
 
 from flask import Flask, render_template, request, jsonify, flash, redirect, url_for
@@ -16,20 +20,31 @@ from analyzer.issue_detector import IssueDetector
 from analyzer.report_generator import ReportGenerator
 from config import Config
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('codepulse.log', mode='a')
-    ]
-)
+# Configure logging: records are queued by the calling thread (including the
+# asyncio loop) and formatted and written by a background listener thread
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [logging.StreamHandler(), logging.FileHandler('codepulse.log', mode='a')]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Listener handlers add the full format
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger(__name__)
 
+# Faster event loop for the async AI analysis (optional, not available on Windows)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Try to import AI components (optional)
 try:
-    from analyzer.ai_analyzer import AIAnalyzer
+    from analyzer.ai_analyzer import AIAnalyzer, create_http_session
     from analyzer.enhanced_report_generator import EnhancedReportGenerator
     AI_AVAILABLE = True
     logger.info("🧠 AI components loaded successfully")
@@ -52,6 +67,39 @@ except ValueError as e:
     print(f"Configuration warning: {e}")
     print("Note: GitHub token is optional for public repositories")
 
+# AI-enhanced analyses all run on one long-lived event loop thread and share one pooled HTTP
+# session, so keep-alive connections to the model endpoint carry over from request to request
+_ai_loop = None
+_ai_session = None
+_ai_loop_lock = threading.Lock()
+
+def _get_ai_session():
+    """Start the shared AI event loop on first use; returns its pooled HTTP session"""
+    global _ai_loop, _ai_session
+    with _ai_loop_lock:
+        if _ai_loop is None:
+            loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+            if hasattr(asyncio, 'eager_task_factory'):
+                # Python 3.12+: tasks that finish without suspending (cache hits, fallbacks) skip a loop cycle
+                loop.set_task_factory(asyncio.eager_task_factory)
+            threading.Thread(target=loop.run_forever, name='ai-event-loop', daemon=True).start()
+            _ai_session = asyncio.run_coroutine_threadsafe(_create_ai_session(), loop).result()
+            _ai_loop = loop
+            atexit.register(_close_ai_session)
+        return _ai_session
+
+async def _create_ai_session():
+    """aiohttp sessions are created on the loop that will use them"""
+    return create_http_session()
+
+def _close_ai_session() -> None:
+    """Close the shared AI session at exit, releasing its pooled connections"""
+    asyncio.run_coroutine_threadsafe(_ai_session.close(), _ai_loop).result(timeout=5)
+
+def _run_ai(coro):
+    """Run a coroutine on the shared AI event loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coro, _ai_loop).result()
+
 @app.route('/')
 def index():
     """Main dashboard page"""
@@ -60,6 +108,7 @@ def index():
 @app.route('/analyze', methods=['POST'])
 def analyze_repository():
     """Analyze a GitHub repository with optional AI enhancement"""
+    github_client = None
     try:
         repo_url = request.form.get('repo_url', '').strip()
         is_public = request.form.get('is_public') == 'on'
@@ -91,7 +140,7 @@ def analyze_repository():
         
         # Choose report generator based on AI setting and availability
         if enable_ai and AI_AVAILABLE:
-            report_generator = EnhancedReportGenerator(github_token)
+            report_generator = EnhancedReportGenerator(github_token, http_session=_get_ai_session())
             analysis_mode = "🧠 AI-Enhanced"
             logger.info(f"🧠 Initializing AI-Enhanced analysis for {repo_path}")
         else:
@@ -135,11 +184,9 @@ def analyze_repository():
         if enable_ai and AI_AVAILABLE:
             logger.info(f"🧠 Starting AI-Enhanced report generation")
             # Run async AI analysis
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
             try:
                 start_time = datetime.now()
-                analysis_report = loop.run_until_complete(
+                analysis_report = _run_ai(
                     report_generator.generate_enhanced_report(
                         repo_info, coverage_results, issues, repo_path=repo_data['local_path'], enable_ai=True
                     )
@@ -167,8 +214,6 @@ def analyze_repository():
             except Exception as e:
                 logger.error(f"❌ AI-Enhanced report generation failed: {str(e)}")
                 raise
-            finally:
-                loop.close()
         else:
             logger.info(f"📊 Starting Standard report generation")
             start_time = datetime.now()
@@ -208,10 +253,14 @@ def analyze_repository():
         print(f"Analysis error: {str(e)}")
         flash(f'Analysis failed: {str(e)}', 'error')
         return redirect(url_for('index'))
+    finally:
+        if github_client is not None:
+            github_client.close()
 
 @app.route('/api/analyze', methods=['POST'])
 def api_analyze():
     """API endpoint for repository analysis with optional AI support"""
+    github_client = None
     try:
         data = request.get_json()
         repo_url = data.get('repo_url', '').strip()
@@ -240,7 +289,7 @@ def api_analyze():
         
         # Choose report generator
         if enable_ai and AI_AVAILABLE:
-            report_generator = EnhancedReportGenerator(github_token)
+            report_generator = EnhancedReportGenerator(github_token, http_session=_get_ai_session())
         else:
             report_generator = ReportGenerator()
         
@@ -252,16 +301,11 @@ def api_analyze():
         
         # Generate report
         if enable_ai and AI_AVAILABLE:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                analysis_report = loop.run_until_complete(
-                    report_generator.generate_enhanced_report(
-                        repo_info, coverage_results, issues, repo_path=repo_data['local_path'], enable_ai=True
-                    )
+            analysis_report = _run_ai(
+                report_generator.generate_enhanced_report(
+                    repo_info, coverage_results, issues, repo_path=repo_data['local_path'], enable_ai=True
                 )
-            finally:
-                loop.close()
+            )
         else:
             analysis_report = report_generator.generate_report(
                 repo_info, coverage_results, issues
@@ -281,6 +325,9 @@ def api_analyze():
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
+    finally:
+        if github_client is not None:
+            github_client.close()
 
 @app.route('/api/ai-insights/<path:repo_path>')
 def get_ai_insights(repo_path):
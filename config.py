@@ -11,6 +11,19 @@ class Config:
     # Analysis configuration
     MAX_REPO_SIZE_MB = 100
     ANALYSIS_TIMEOUT = 300  # 5 minutes
+    # Source files are scanned on a process pool once a repository has at least this many
+    ISSUE_SCAN_WORKERS = int(os.environ.get('ISSUE_SCAN_WORKERS', str(os.cpu_count() or 1)))
+    ISSUE_SCAN_PARALLEL_MIN_FILES = int(os.environ.get('ISSUE_SCAN_PARALLEL_MIN_FILES', '200'))
+    ISSUE_SCAN_MAX_FILE_BYTES = int(os.environ.get('ISSUE_SCAN_MAX_FILE_BYTES', '2000000'))  # larger files are skipped
+    GITHUB_CACHE_TTL = int(os.environ.get('GITHUB_CACHE_TTL', '300'))  # seconds
+    GITHUB_CACHE_SIZE = int(os.environ.get('GITHUB_CACHE_SIZE', '256'))
+    # Opt-in persistent HTTP cache for unauthenticated GitHub API responses (used when hishel is installed)
+    # Kept in the user's own cache directory, readable by the owner only
+    GITHUB_HTTP_CACHE = os.environ.get('GITHUB_HTTP_CACHE', 'False').lower() == 'true'
+    GITHUB_HTTP_CACHE_PATH = os.environ.get('GITHUB_HTTP_CACHE_PATH', os.path.join(
+        os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+        'codepulse', 'http_cache.sqlite'))
+    GITHUB_HTTP_CACHE_TTL = int(os.environ.get('GITHUB_HTTP_CACHE_TTL', '3600'))  # seconds
     
     # Test coverage thresholds
     COVERAGE_EXCELLENT = 90
@@ -23,6 +36,14 @@ class Config:
     AI_MAX_TOKENS = int(os.environ.get('AI_MAX_TOKENS', '4000'))
     AI_TEMPERATURE = float(os.environ.get('AI_TEMPERATURE', '0.3'))
     AI_TIMEOUT = int(os.environ.get('AI_TIMEOUT', '30'))
+    AI_MAX_CONCURRENCY = int(os.environ.get('AI_MAX_CONCURRENCY', '4'))  # model requests in flight per report
+    AI_MAX_CODE_FILES = int(os.environ.get('AI_MAX_CODE_FILES', '3'))  # source files sent for AI issue detection
+    AI_CACHE_SIZE = int(os.environ.get('AI_CACHE_SIZE', '1024'))
+    AI_CACHE_TTL = int(os.environ.get('AI_CACHE_TTL', '3600'))  # seconds
+    # Near-duplicate prompt reuse trades exactness for fewer calls, so it is opt-in
+    AI_SEMANTIC_CACHE = os.environ.get('AI_SEMANTIC_CACHE', 'False').lower() == 'true'
+    AI_SEMANTIC_CACHE_THRESHOLD = float(os.environ.get('AI_SEMANTIC_CACHE_THRESHOLD', '0.92'))
+    AI_SEMANTIC_CACHE_SIZE = int(os.environ.get('AI_SEMANTIC_CACHE_SIZE', '256'))
     
     # GitHub Models Configuration
     GITHUB_MODELS_ENDPOINT = "https://models.github.ai/inference"
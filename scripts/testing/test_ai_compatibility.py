@@ -66,7 +66,7 @@ async def test_ai_components():
         }
         
         try:
-            analysis = await ai_analyzer.analyze_code_quality(
+            analysis = await ai_analyzer.analyze_file_quality(
                 "print('hello world')", 
                 "test.py", 
                 "python"
@@ -0,0 +1,65 @@
+"""Tests for response caching in analyzer.ai_analyzer"""
+
+import pytest
+
+from analyzer import ai_analyzer
+from analyzer.ai_analyzer import AIAnalyzer, SemanticPromptCache
+from config import Config
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    """An analyzer whose model requests are recorded instead of sent, with both caches enabled and empty"""
+    monkeypatch.setattr(Config, 'ENABLE_CACHING', True)
+    monkeypatch.setattr(Config, 'AI_SEMANTIC_CACHE', True)
+    monkeypatch.setattr(ai_analyzer, '_semantic_cache', SemanticPromptCache())
+    ai_analyzer._response_cache.clear()
+    analyzer = AIAnalyzer('test-token')
+    analyzer.requests = []
+
+    async def request_completion(prompt, schema=None):
+        analyzer.requests.append(prompt)
+        return {'answer': len(analyzer.requests)}
+    monkeypatch.setattr(analyzer, '_request_completion', request_completion)
+    yield analyzer
+    ai_analyzer._response_cache.clear()
+
+
+def test_semantic_lookup_stays_within_scope():
+    cache = SemanticPromptCache()
+    vector = cache.embed('python 120 45 2 3')
+    cache.add('model|architecture|acme/api', vector, 'cached')
+
+    assert cache.lookup('model|architecture|acme/api', cache.embed('python 120 45 2 3')) == 'cached'
+    assert cache.lookup('model|architecture|other/app', vector) is None
+    assert cache.lookup('model|security|acme/api', vector) is None
+
+
+async def test_other_repository_gets_its_own_answer(analyzer):
+    boilerplate = 'Analyze this repository. ' * 50
+    first = await analyzer._call_ai_model(boilerplate + 'files: a.py', 'architecture',
+                                          repo='acme/api', variable_text='files: a.py')
+    second = await analyzer._call_ai_model(boilerplate + 'files: a.py b.py', 'architecture',
+                                           repo='other/app', variable_text='files: a.py b.py')
+
+    assert first != second
+    assert len(analyzer.requests) == 2
+
+
+async def test_unscoped_prompts_only_reuse_exact_repeats(analyzer):
+    boilerplate = 'Analyze this repository. ' * 50
+    await analyzer._call_ai_model(boilerplate + 'coverage 40', 'code_quality')
+    await analyzer._call_ai_model(boilerplate + 'coverage 41', 'code_quality')
+    await analyzer._call_ai_model(boilerplate + 'coverage 41', 'code_quality')
+
+    assert len(analyzer.requests) == 2
+
+
+async def test_near_duplicate_in_same_repository_is_reused(analyzer):
+    sections = 'def handler(request): return render(request, "index.html") ' * 20
+    await analyzer._call_ai_model('prompt ' + sections, 'code_quality', repo='acme/api', variable_text=sections)
+    result = await analyzer._call_ai_model('prompt ' + sections + ' x', 'code_quality',
+                                           repo='acme/api', variable_text=sections + ' x')
+
+    assert result == {'answer': 1}
+    assert len(analyzer.requests) == 1
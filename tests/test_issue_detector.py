@@ -0,0 +1,279 @@
+"""Tests for the single-pass issue scanner in analyzer.issue_detector"""
+
+import os
+import random
+import re
+
+import pytest
+
+from analyzer import issue_detector
+from analyzer.issue_detector import IssueDetector, _scandir_walk
+from config import Config
+
+
+# File types each regex check covered before the scan was merged into one pass per file
+SECURITY_EXTENSIONS = ('.py', '.js', '.ts', '.java', '.cs', '.php')
+QUALITY_EXTENSIONS = ('.py', '.js', '.ts', '.java', '.cs')
+PERFORMANCE_EXTENSIONS = ('.py', '.js', '.ts')
+
+REGEX_CHECK_TYPES = frozenset({
+    'hardcoded_secret', 'sql_injection', 'xss_vulnerability',
+    'todo_comment', 'magic_number', 'inefficient_loop', 'memory_leak_risk'
+})
+
+FIXTURE_FILES = {
+    'src/app.py': (
+        'import os\n'
+        '\n'
+        'password = "hunter2"\n'
+        "API_KEY='abc123'  # TODO rotate\n"
+        'def load(items):\n'
+        '    for i in range(len(items)):\n'
+        '        print(items[i] * 1000)\n'
+        '    cache = {}\n'
+        '    return 4096  # 4096 bytes\n'
+    ),
+    'src/unicode.py': (
+        "café = 'naïve'; token = 'ü'\n"
+        'XXX revisit ٣٤٥ and 12\n'
+        'limit = ١٢٣٤\n'
+    ),
+    'src/legacy.py': (
+        'print "python 2"\n'
+        'class Old:\n'
+        '    pass\n'
+        'def run(cmd):\n'
+        '    while len(cmd): cmd.pop()\n'
+    ),
+    'web/page.js': (
+        'const token = "xyz";\n'
+        'el.innerHTML = "<b>" + name;\n'
+        'document.write(name);\n'
+        'eval (code);\n'
+        'db.query("SELECT * FROM t WHERE id=" + id + "");\n'
+        '// FIXME: 2500 retries\n'
+        'let timeout = 30000;\n'
+    ),
+    'web/crlf.ts': (
+        'const secret = "abc";\r\n'
+        'global cache = []\r\n'
+        'for (const x in range(len(items))) {}\r\n'
+        'const port = 8080;\r\n'
+    ),
+    'Service.java': (
+        'stmt.execute("DELETE FROM t WHERE id=" + id + "");\n'
+        'int port = 8080;\n'
+        'String secret = "s3cr3t";  // HACK\n'
+    ),
+    'legacy.php': (
+        "$Password = 'x';\n"
+        "eval($_GET['c']);\n"
+        '$n = 12345;\n'
+    ),
+    'notes.txt': 'password = "ignored"\n',
+    '.hidden/secret.py': 'password = "hidden"\n'
+}
+
+
+def baseline_regex_issues(detector, content, relative_path):
+    """Regex findings for one file the way the per-category scans reported them: every pattern against every line"""
+    extension = os.path.splitext(relative_path)[1]
+    patterns = detector.issue_patterns
+    lines = content.split('\n')
+    found = []
+
+    def scan(issue_type, regexes):
+        for i, line in enumerate(lines, 1):
+            for pattern in regexes:
+                if pattern.search(line):
+                    found.append((issue_type, i, None))
+
+    if extension in SECURITY_EXTENSIONS:
+        scan('hardcoded_secret', patterns['security']['hardcoded_secrets'])
+        scan('sql_injection', patterns['security']['sql_injection'])
+        scan('xss_vulnerability', patterns['security']['xss_vulnerabilities'])
+    if extension in QUALITY_EXTENSIONS:
+        for i, line in enumerate(lines, 1):
+            if patterns['code_quality']['todo_comments'].search(line):
+                found.append(('todo_comment', i, None))
+        for i, line in enumerate(lines, 1):
+            matches = patterns['code_quality']['magic_numbers'].findall(line)
+            if matches and not re.search(r'#.*\d+', line):
+                found.append(('magic_number', i, f'Magic number(s) found: {", ".join(matches)}'))
+    if extension in PERFORMANCE_EXTENSIONS:
+        scan('inefficient_loop', patterns['performance']['inefficient_loops'])
+        scan('memory_leak_risk', patterns['performance']['memory_leaks'])
+    return found
+
+
+def write_tree(root, files):
+    for relative_path, content in files.items():
+        path = root / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content.encode('utf-8'))
+
+
+def by_file(issues):
+    """Regex findings grouped per file as (type, line, description) in reported order"""
+    grouped = {}
+    for issue in issues:
+        if issue['type'] in REGEX_CHECK_TYPES:
+            description = issue['description'] if issue['type'] == 'magic_number' else None
+            grouped.setdefault(issue['file'], []).append((issue['type'], issue['line'], description))
+    return grouped
+
+
+@pytest.fixture(params=['regex', 'hyperscan'])
+def detector(request, monkeypatch):
+    """A serial detector using either the per-check regex prefilters or the shared hyperscan pass"""
+    monkeypatch.setattr(Config, 'ISSUE_SCAN_WORKERS', 1)
+    detector = IssueDetector()
+    if request.param == 'regex':
+        detector._hyperscan = None
+    elif detector._hyperscan is None:
+        pytest.skip('hyperscan is not installed')
+    return detector
+
+
+class TestScannerEquivalence:
+    """The merged scan reports what the original line-by-line regex scans did"""
+
+    def test_fixture_tree_matches_baseline(self, detector, tmp_path):
+        write_tree(tmp_path, FIXTURE_FILES)
+        issues = detector.detect_issues(str(tmp_path), {'stats': {}})
+
+        reported = {}
+        for category in ('security_issues', 'code_quality_issues', 'performance_issues'):
+            for file, found in by_file(issues[category]).items():
+                reported.setdefault(file, []).extend(found)
+
+        expected = {}
+        for relative_path, content in FIXTURE_FILES.items():
+            if relative_path.startswith('.'):
+                continue
+            found = baseline_regex_issues(detector, content, relative_path)
+            if found:
+                expected[os.path.normpath(relative_path)] = found
+
+        assert 'error' not in issues
+        assert {file: sorted(found) for file, found in reported.items()} == \
+            {file: sorted(found) for file, found in expected.items()}
+
+    def test_per_category_order_matches_baseline(self, detector):
+        content = FIXTURE_FILES['web/page.js']
+        security = detector._scan_security(content, 'page.js')
+        expected = [(t, line) for t, line, _ in baseline_regex_issues(detector, content, 'page.js')
+                    if t in ('hardcoded_secret', 'sql_injection', 'xss_vulnerability')]
+        assert [(issue['type'], issue['line']) for issue in security] == expected
+
+    @pytest.mark.filterwarnings('ignore::SyntaxWarning')
+    def test_random_sources_match_baseline(self, detector, tmp_path):
+        tokens = ['password', 'TOKEN', 'api_key', ' = ', '=', '"', "'", 'abc', '+', 'execute(', 'query (',
+                  'innerHTML =', 'document.write(', 'eval (', 'for x in range(len(', 'while len(',
+                  'global a = []', 'cache = {}', '\n', '\n', '\r\n', '1234', '# 999', 'TODO', 'XXX', ' ', '\t',
+                  '٣٤٥', 'é']
+        rng = random.Random(7)
+        for k in range(60):
+            for extension in ('.py', '.js', '.java', '.php'):
+                relative_path = f'f{k}{extension}'
+                content = ''.join(rng.choice(tokens) for _ in range(rng.randint(0, 60)))
+                (tmp_path / relative_path).write_bytes(content.encode('utf-8'))
+
+                results = detector._scan_source_file(str(tmp_path / relative_path), relative_path) or {}
+                reported = [found for category in ('security_issues', 'code_quality_issues', 'performance_issues')
+                            for found in by_file(results.get(category, [])).get(relative_path, [])]
+                assert sorted(reported) == sorted(baseline_regex_issues(detector, content, relative_path)), content
+
+
+class TestScanSourceFile:
+    """Per-file scanning details"""
+
+    def test_binary_file_is_skipped(self, tmp_path):
+        path = tmp_path / 'blob.py'
+        path.write_bytes(b'password = "x"\n\x00\x01\x02')
+        assert IssueDetector()._scan_source_file(str(path), 'blob.py') is None
+
+    def test_unparsable_python_keeps_docstring_checks(self, tmp_path):
+        path = tmp_path / 'legacy.py'
+        path.write_text(FIXTURE_FILES['src/legacy.py'])
+        results = IssueDetector()._scan_source_file(str(path), 'legacy.py')
+        assert [(issue['line'], issue['description']) for issue in results['documentation_issues']] == [
+            (2, 'Missing docstring for class: Old:'),
+            (4, 'Missing docstring for function: run')
+        ]
+
+    def test_failing_check_keeps_other_categories(self, tmp_path, monkeypatch):
+        path = tmp_path / 'app.py'
+        path.write_text(FIXTURE_FILES['src/app.py'])
+        detector = IssueDetector()
+
+        def fail(*args):
+            raise RuntimeError('check failed')
+        monkeypatch.setattr(detector, '_scan_performance', fail)
+
+        results = detector._scan_source_file(str(path), 'app.py')
+        assert 'performance_issues' not in results
+        assert results['security_issues']
+        assert results['scan_errors'] == [
+            {'file': 'app.py', 'check': '_scan_performance', 'error': 'RuntimeError: check failed'}
+        ]
+
+    def test_failing_check_is_logged_and_reported(self, tmp_path, monkeypatch, caplog):
+        write_tree(tmp_path, {'app.py': FIXTURE_FILES['src/app.py']})
+        monkeypatch.setattr(Config, 'ISSUE_SCAN_WORKERS', 1)
+        detector = IssueDetector()
+
+        def fail(*args):
+            raise RuntimeError('check failed')
+        monkeypatch.setattr(detector, '_scan_performance', fail)
+
+        with caplog.at_level('WARNING', logger='analyzer.issue_detector'):
+            issues = detector.detect_issues(str(tmp_path), {'stats': {}})
+        assert issues['scan_errors'] == [
+            {'file': 'app.py', 'check': '_scan_performance', 'error': 'RuntimeError: check failed'}
+        ]
+        assert '_scan_performance failed on app.py' in caplog.text
+        assert issues['security_issues']
+
+
+class TestScandirWalk:
+    """File collection skips what the scan should never read"""
+
+    def test_filters_hidden_vendored_minified_and_large_files(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Config, 'ISSUE_SCAN_MAX_FILE_BYTES', 100)
+        write_tree(tmp_path, {
+            'main.py': 'x = 1\n',
+            'src/util.js': 'let x = 1;\n',
+            'src/bundle.min.js': 'let x=1;\n',
+            'src/huge.py': 'x = 1\n' * 50,
+            'src/readme.md': '# docs\n',
+            '.git/hooks/pre-commit.py': 'x = 1\n',
+            'node_modules/lib/index.js': 'x = 1\n',
+            'venv/lib/site.py': 'x = 1\n',
+            '__pycache__/mod.py': 'x = 1\n'
+        })
+
+        collected = sorted(rel for _, rel in _scandir_walk(str(tmp_path), issue_detector._COLLECTED_EXTENSIONS))
+        assert collected == ['main.py', os.path.join('src', 'util.js')]
+
+    def test_yields_paths_top_down(self, tmp_path):
+        write_tree(tmp_path, {'pkg/sub/c.py': '', 'pkg/b.py': '', 'a.py': ''})
+
+        walked = list(_scandir_walk(str(tmp_path), frozenset({'.py'})))
+        relative_paths = [rel for _, rel in walked]
+        assert sorted(relative_paths) == ['a.py', os.path.join('pkg', 'b.py'), os.path.join('pkg', 'sub', 'c.py')]
+        assert relative_paths.index(os.path.join('pkg', 'b.py')) < relative_paths.index(os.path.join('pkg', 'sub', 'c.py'))
+        assert all(path == os.path.join(str(tmp_path), rel) for path, rel in walked)
+
+    @pytest.mark.skipif(not issue_detector.PATHSPEC_AVAILABLE, reason='pathspec is not installed')
+    def test_respects_gitignore(self, tmp_path):
+        write_tree(tmp_path, {
+            '.gitignore': 'generated/\n*_pb2.py\n!keep_pb2.py\n',
+            'app.py': '',
+            'generated/models.py': '',
+            'proto/api_pb2.py': '',
+            'proto/keep_pb2.py': ''
+        })
+
+        collected = sorted(rel for _, rel in IssueDetector()._collect_files(str(tmp_path)))
+        assert collected == ['app.py', os.path.join('proto', 'keep_pb2.py')]
@@ -0,0 +1,65 @@
+"""Tests for the score band and rule tables in analyzer.report_generator"""
+
+from collections import Counter
+
+import pytest
+
+from analyzer.report_generator import ReportGenerator
+
+
+def baseline_status(health_score):
+    """Health status as the original if/elif ladder assigned it"""
+    if health_score >= 80:
+        return 'Excellent', 'green'
+    elif health_score >= 60:
+        return 'Good', 'blue'
+    elif health_score >= 40:
+        return 'Fair', 'orange'
+    else:
+        return 'Needs Improvement', 'red'
+
+
+def baseline_coverage_level(coverage):
+    """Coverage level as the original if/elif ladder assigned it"""
+    if coverage >= 90:
+        return 'Excellent', 'green'
+    elif coverage >= 75:
+        return 'Good', 'blue'
+    elif coverage >= 50:
+        return 'Fair', 'orange'
+    else:
+        return 'Poor', 'red'
+
+
+# Each band's edges and their neighbours, plus the extremes
+SCORES = [-5, 0, 0.5, 29.9, 39.9, 39.99, 40, 40.01, 49.9, 50, 59.9, 60, 74.9, 75, 79.9, 80, 89.9, 90, 99.9, 100, 120]
+
+
+@pytest.mark.parametrize('health_score', SCORES)
+def test_status_matches_ladder(health_score):
+    summary = ReportGenerator()._generate_summary({}, {}, 0, {}, Counter(), {'health_score': health_score})
+    assert (summary['status'], summary['status_color']) == baseline_status(health_score)
+
+
+@pytest.mark.parametrize('coverage', SCORES)
+def test_coverage_level_matches_ladder(coverage):
+    analysis = ReportGenerator()._generate_test_analysis({'coverage_metrics': {'overall': coverage}})
+    assert (analysis['coverage_level'], analysis['coverage_color']) == baseline_coverage_level(coverage)
+
+
+def test_missing_coverage_is_poor():
+    analysis = ReportGenerator()._generate_test_analysis({})
+    assert (analysis['coverage_level'], analysis['coverage_color']) == ('Poor', 'red')
+
+
+def test_action_lists_are_fresh_lists():
+    generator = ReportGenerator()
+    issues = {'security_issues': [{'severity': 'critical'}], 'documentation_issues': [{}] * 3}
+    first = generator._generate_recommendations(10, issues, Counter(critical=1))
+    first[0]['actions'].append('Extra step')
+    second = generator._generate_recommendations(10, issues, Counter(critical=1))
+
+    assert all(type(item['actions']) is list for item in second)
+    assert 'Extra step' not in second[0]['actions']
+    areas = generator._identify_improvement_areas(10, issues, Counter(critical=1))
+    assert areas and all(type(area['key_actions']) is list for area in areas)